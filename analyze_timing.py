@@ -6,36 +6,203 @@ Usage:
     python analyze_timing.py path/to/file     # read specific file
     python analyze_timing.py --last N         # only analyze last N runs
     python analyze_timing.py --outlier 2.0    # set outlier z-score threshold (default 2.5)
+    python analyze_timing.py --convert out.mpk  # rewrite the log as length-prefixed msgpack
+
+Files ending in .mpk are read as 4-byte little-endian length-prefixed msgpack records
+(requires the msgpack package); anything else is read as JSONL.
 """
 
+import itertools
 import json
+import mmap
 import os
+import struct
 import sys
-import statistics
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 DEFAULT_PATH = "log/timing/timing.jsonl"
 DEFAULT_OUTLIER_Z = 2.5
 HIGH_VARIANCE_CV = 0.4  # coefficient of variation threshold for flagging noisy phases
+_EMPTY_PHASES: dict = {}  # shared stand-in for records without phases
+
+# Report line formats, parsed once
+ROW_FMT = "  {phase:<30s} {count:>5d}  {mean:>5.1f}s  {p50:>5.1f}s  {p90:>5.1f}s  {mx:>5.1f}s  {cv:>4.2f}"
+OUTLIER_FMT = "  Run #{run:4d}  {ts}  {phase}: {duration:.1f}s  (avg={mean:.1f}s, z={z:.1f})"
+NOISY_FMT = "  {phase:<32s} cv={cv:.2f}  range=[{mn:.1f}s, {mx:.1f}s]"
+
 
+MPK_HEADER = struct.Struct("<I")
 
-def load_records(path: str) -> list[dict]:
+
+def _iter_records(path: str):
+    """Yield parsed records from a JSONL or .mpk timing log."""
     if not os.path.exists(path):
         print(f"No timing data found at {path}")
         print("Run the bot first — data is written after each run.")
         sys.exit(0)
-    records = []
-    with open(path, encoding="utf-8") as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    if path.endswith(".mpk"):
+        return _iter_mpk_records(path)
+    return _iter_jsonl_records(path)
+
+
+def _iter_jsonl_records(path: str):
+    """Yield every record in a JSONL file, skipping blank and malformed lines."""
+    # mmap + binary lines: orjson parses the bytes directly, no decode or strip needed
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = iter(mm.readline, b"")
+            for i, line in enumerate(lines, 1):
+                try:
+                    # A clean line parses with no extra checks
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    # From the first bad line on, parse line by line, reporting what gets skipped
+                    yield from _parse_lines_checked(itertools.chain((line,), lines), start=i)
+                    return
+                yield record
+
+
+def _parse_lines_checked(lines, start: int = 1):
+    """Slow path: parse line by line, reporting what gets skipped."""
+    for i, line in enumerate(lines, start):
+        if not line.strip():
+            continue
+        try:
+            yield _loads(line)
+        except json.JSONDecodeError as e:
+            print(f"  Warning: skipping malformed record on line {i}: {e}")
+
+
+def _iter_mpk_records(path: str):
+    """Yield records from a length-prefixed msgpack file, stopping at a truncated tail."""
+    if msgpack is None:
+        print(f"Reading {path} requires the msgpack package (pip install msgpack)")
+        sys.exit(1)
+    with open(path, "rb") as f:
+        i = 0
+        while hdr := f.read(MPK_HEADER.size):
+            i += 1
+            size = MPK_HEADER.unpack(hdr)[0] if len(hdr) == MPK_HEADER.size else -1
+            body = f.read(size) if size >= 0 else b""
+            if len(body) != size:
+                print(f"  Warning: truncated record {i}, stopping")
+                return
             try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError as e:
-                print(f"  Warning: skipping malformed record on line {i}: {e}")
-    return records
+                yield msgpack.unpackb(body)
+            except ValueError as e:
+                print(f"  Warning: skipping malformed record {i}: {e}")
+
+
+def convert_jsonl_to_mpk(src: str, dst: str) -> int:
+    """Rewrite a JSONL timing log as length-prefixed msgpack records. Returns the record count."""
+    if msgpack is None:
+        print("Converting requires the msgpack package (pip install msgpack)")
+        sys.exit(1)
+    n = 0
+    with open(dst, "wb") as out:
+        for record in _iter_jsonl_records(src):
+            body = msgpack.packb(record)
+            out.write(MPK_HEADER.pack(len(body)))
+            out.write(body)
+            n += 1
+    return n
+
+
+def load_and_bucket(path: str, last_n: int | None = None):
+    """Load records and bucket durations per phase in a single pass.
+
+    Only a compact (ts, total, [(phase, duration), ...]) tuple is retained per run,
+    and at most `last_n` of them when set.
+
+    Returns (phase_data, total_vals, ts_list, per_run). With numpy, per_run is a dense
+    float64 (n_runs, n_phases) duration matrix, NaN where a run skipped a phase, whose
+    columns follow phase_data's key order; phase_data and total_vals are float64 arrays.
+    Without numpy, per_run is the list of [(phase, duration), ...] per run.
+    """
+    if last_n is not None and last_n <= 0:
+        last_n = None  # --last 0 means all runs, as it did before
+    n_loaded = 0
+    runs = deque(maxlen=last_n)
+    # Interned phase names: ~30 distinct strings shared by every retained run,
+    # and identity-fast dict lookups when bucketing
+    intern = sys.intern
+    for record in _iter_records(path):
+        n_loaded += 1
+        phases = record.get("phases") or _EMPTY_PHASES
+        runs.append((record.get("ts"), record.get("total"), [(intern(phase), duration) for phase, duration in phases.items()]))
+
+    print(f"Loaded {n_loaded} runs from {path}")
+    if last_n is not None and last_n < n_loaded:
+        print(f"Analyzing last {last_n} runs only")
+
+    if np is not None:
+        return _bucket_dense(runs)
+
+    phase_data: dict[str, list[float]] = {}
+    total_vals: list[float] = []
+    ts_list = []
+    phases_per_record = []
+    for ts, total, phases in runs:
+        for phase, duration in phases:
+            phase_data.setdefault(phase, []).append(duration)
+        if total is not None:
+            total_vals.append(total)
+        ts_list.append(ts)
+        phases_per_record.append(phases)
+    return phase_data, total_vals, ts_list, phases_per_record
+
+
+def _bucket_dense(runs):
+    """SoA layout of the retained runs: one float64 matrix instead of per-run lists.
+
+    float64 so every duration is exactly the logged value, as the report prints them.
+    """
+    # First pass: the phase set, in order of first appearance
+    phase_index: dict[str, int] = {}
+    for _, _, phases in runs:
+        for phase, _ in phases:
+            if phase not in phase_index:
+                phase_index[phase] = len(phase_index)
+    # Second pass: fill the matrix
+    durations = np.full((len(runs), len(phase_index)), np.nan, dtype=np.float64)
+    totals = np.full(len(runs), np.nan, dtype=np.float64)
+    ts_list = []
+    for i, (ts, total, phases) in enumerate(runs):
+        row = durations[i]
+        for phase, duration in phases:
+            row[phase_index[phase]] = duration
+        if total is not None:
+            totals[i] = total
+        ts_list.append(ts)
+    present = ~np.isnan(durations)
+    phase_data = {phase: durations[present[:, j], j] for phase, j in phase_index.items()}
+    total_vals = totals[~np.isnan(totals)]
+    return phase_data, total_vals, ts_list, durations
 
 
 def fmt_ts(ts: float) -> str:
@@ -50,86 +217,188 @@ def percentile(sorted_vals: list[float], p: float) -> float:
     return sorted_vals[idx]
 
 
-def analyze(records: list[dict], outlier_z: float):
-    n = len(records)
-    print(f"\n=== Phase Timing Summary (N={n} runs) ===")
-    print(f"{'Phase':<32s} {'count':>5s}  {'mean':>6s}  {'p50':>6s}  {'p90':>6s}  {'max':>6s}  {'cv':>5s}  note")
-    print("-" * 82)
+def _welford(vals) -> tuple[float, float]:
+    """One-pass (mean, sample stdev), avoiding statistics.stdev's second pass over the data."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in vals:
+        n += 1
+        d = x - mean
+        mean += d / n
+        m2 += (x - mean) * d
+    return mean, (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
 
-    # Collect values per phase
-    phase_data: dict[str, list[float]] = {}
-    for record in records:
-        for phase, duration in record.get("phases", {}).items():
-            phase_data.setdefault(phase, []).append(duration)
+
+def summarize(vals) -> tuple[float, float, float, float, float]:
+    """Return (mean, stdev, p50, p90, max) for a non-empty sequence of durations."""
+    if np is not None:
+        arr = np.asarray(vals, dtype=np.float64)
+        mean = float(arr.mean())
+        stdev = float(arr.std(ddof=1)) if arr.size > 1 else 0.0
+        # Two order statistics via introselect (O(N)) instead of a full sort,
+        # same index truncation as percentile()
+        n = arr.size
+        k50 = min(n * 50 // 100, n - 1)
+        k90 = min(n * 90 // 100, n - 1)
+        part = np.partition(arr, [k50, k90])
+        return mean, stdev, float(part[k50]), float(part[k90]), float(arr.max())
+    mean, stdev = _welford(vals)
+    sv = sorted(vals)
+    return mean, stdev, percentile(sv, 0.5), percentile(sv, 0.9), sv[-1]
+
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _phase_stats_kernel(values, offsets):
+        """Per-phase (mean, stdev, p50, p90, max) over values[offsets[k]:offsets[k + 1]]."""
+        n_phases = offsets.size - 1
+        means = np.empty(n_phases)
+        stdevs = np.empty(n_phases)
+        p50s = np.empty(n_phases)
+        p90s = np.empty(n_phases)
+        maxs = np.empty(n_phases)
+        for k in range(n_phases):
+            seg = values[offsets[k]:offsets[k + 1]]
+            # Welford: one pass for mean, variance and max
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            mx = -np.inf
+            for x in seg:
+                n += 1
+                d = x - mean
+                mean += d / n
+                m2 += (x - mean) * d
+                if x > mx:
+                    mx = x
+            means[k] = mean
+            stdevs[k] = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+            k50 = min(n * 50 // 100, n - 1)
+            k90 = min(n * 90 // 100, n - 1)
+            part = np.partition(seg, [k50, k90])
+            p50s[k] = part[k50]
+            p90s[k] = part[k90]
+            maxs[k] = mx
+        return means, stdevs, p50s, p90s, maxs
+else:
+    _phase_stats_kernel = None
+
+
+def summarize_phases(phase_data: dict) -> dict[str, tuple[float, float, float, float, float]]:
+    """Return {phase: (mean, stdev, p50, p90, max)} for every phase with at least one value."""
+    phase_data = {phase: vals for phase, vals in phase_data.items() if len(vals) > 0}
+    if _phase_stats_kernel is None or not phase_data:
+        return {phase: summarize(vals) for phase, vals in phase_data.items()}
+    # One fused kernel call over all phases laid out back to back
+    values = np.concatenate([np.asarray(vals, dtype=np.float64) for vals in phase_data.values()])
+    offsets = np.cumsum([0] + [len(vals) for vals in phase_data.values()])
+    stats = zip(*(a.tolist() for a in _phase_stats_kernel(values, offsets)))
+    return dict(zip(phase_data, stats))
+
+
+def find_outliers(per_run, phase_stats: dict[str, tuple], outlier_z: float):
+    """Yield (run_index, [(z, phase, duration, mean), ...]) for each run with phases >= outlier_z.
+
+    `per_run` is what load_and_bucket returned: the dense duration matrix with numpy,
+    else per-run (phase, duration) lists.
+    """
+    if np is None:
+        for i, phases in enumerate(per_run):
+            run_outliers = []
+            for phase, duration in phases:
+                if phase not in phase_stats:
+                    continue
+                mean, stdev = phase_stats[phase]
+                if stdev > 0:
+                    z = (duration - mean) / stdev
+                    if z >= outlier_z:
+                        run_outliers.append((z, phase, duration, mean))
+            if run_outliers:
+                yield i, run_outliers
+        return
+
+    # Columns of the duration matrix line up with phase_stats, which follows phase_data
+    names = list(phase_stats)
+    durations = per_run.astype(np.float64)
+    means = np.array([phase_stats[phase][0] for phase in names])
+    stdevs = np.array([phase_stats[phase][1] for phase in names])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(stdevs > 0, (durations - means) / stdevs, 0.0)
+    # NaN never compares >= so missing phases drop out here
+    hits = np.argwhere(z >= outlier_z)
+    if hits.size == 0:
+        return
+    runs, starts = np.unique(hits[:, 0], return_index=True)
+    for i, cols in zip(runs, np.split(hits[:, 1], starts[1:])):
+        yield int(i), [(float(z[i, j]), names[j], float(durations[i, j]), float(means[j])) for j in cols]
+
+
+def analyze(phase_data: dict, total_vals, ts_list: list, per_run, outlier_z: float):
+    # The report is collected here and written once at the end
+    out = []
+    n = len(per_run)
+    out.append(f"\n=== Phase Timing Summary (N={n} runs) ===")
+    out.append(f"{'Phase':<32s} {'count':>5s}  {'mean':>6s}  {'p50':>6s}  {'p90':>6s}  {'max':>6s}  {'cv':>5s}  note")
+    out.append("-" * 82)
 
     # Sort by mean duration descending (biggest time sinks first)
     phase_stats: dict[str, tuple] = {}
     rows = []
-    for phase, vals in phase_data.items():
-        if len(vals) == 0:
-            continue
-        mean = statistics.mean(vals)
-        stdev = statistics.stdev(vals) if len(vals) > 1 else 0.0
-        sv = sorted(vals)
-        p50 = percentile(sv, 0.5)
-        p90 = percentile(sv, 0.9)
-        mx = sv[-1]
+    for phase, (mean, stdev, p50, p90, mx) in summarize_phases(phase_data).items():
+        vals = phase_data[phase]
         cv = stdev / mean if mean > 0 else 0.0
         phase_stats[phase] = (mean, stdev)
         note = "HIGH VARIANCE" if cv > HIGH_VARIANCE_CV else ""
         rows.append((mean, phase, len(vals), mean, p50, p90, mx, cv, note))
 
     rows.sort(key=lambda r: r[0], reverse=True)
-    for _, phase, count, mean, p50, p90, mx, cv, note in rows:
-        print(f"  {phase:<30s} {count:>5d}  {mean:>5.1f}s  {p50:>5.1f}s  {p90:>5.1f}s  {mx:>5.1f}s  {cv:>4.2f}  {note}")
+    row_fmt = ROW_FMT.format
+    out.extend(
+        row_fmt(phase=phase, count=count, mean=mean, p50=p50, p90=p90, mx=mx, cv=cv) + "  " + note
+        for _, phase, count, mean, p50, p90, mx, cv, note in rows
+    )
 
     # Total row
-    total_vals = [r.get("total", 0) for r in records if "total" in r]
-    if total_vals:
-        mean_t = statistics.mean(total_vals)
-        sv_t = sorted(total_vals)
-        p50_t = percentile(sv_t, 0.5)
-        p90_t = percentile(sv_t, 0.9)
-        mx_t = sv_t[-1]
-        cv_t = (statistics.stdev(total_vals) / mean_t) if len(total_vals) > 1 and mean_t > 0 else 0.0
-        print("-" * 82)
-        print(f"  {'TOTAL (full cycle)':<30s} {len(total_vals):>5d}  {mean_t:>5.1f}s  {p50_t:>5.1f}s  {p90_t:>5.1f}s  {mx_t:>5.1f}s  {cv_t:>4.2f}")
+    if len(total_vals):
+        mean_t, stdev_t, p50_t, p90_t, mx_t = summarize(total_vals)
+        cv_t = stdev_t / mean_t if mean_t > 0 else 0.0
+        out.append("-" * 82)
+        out.append(row_fmt(phase="TOTAL (full cycle)", count=len(total_vals), mean=mean_t, p50=p50_t, p90=p90_t, mx=mx_t, cv=cv_t))
 
     # Outlier detection
-    if len(records) < 5:
-        print(f"\n(Need at least 5 runs for outlier detection, have {n})")
+    if n < 5:
+        out.append(f"\n(Need at least 5 runs for outlier detection, have {n})")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
-    print(f"\n=== Outlier Runs (phase > mean + {outlier_z}σ) ===")
+    out.append(f"\n=== Outlier Runs (phase > mean + {outlier_z}σ) ===")
     found_outliers = False
-    for i, record in enumerate(records):
-        ts_str = fmt_ts(record["ts"]) if "ts" in record else f"run #{i+1}"
-        run_outliers = []
-        for phase, duration in record.get("phases", {}).items():
-            if phase not in phase_stats:
-                continue
-            mean, stdev = phase_stats[phase]
-            if stdev > 0:
-                z = (duration - mean) / stdev
-                if z >= outlier_z:
-                    run_outliers.append((z, phase, duration, mean))
-        if run_outliers:
-            found_outliers = True
-            run_outliers.sort(key=lambda x: x[0], reverse=True)
-            for z, phase, duration, mean in run_outliers:
-                print(f"  Run #{i+1:4d}  {ts_str}  {phase}: {duration:.1f}s  (avg={mean:.1f}s, z={z:.1f})")
+    outlier_fmt = OUTLIER_FMT.format
+    for i, run_outliers in find_outliers(per_run, phase_stats, outlier_z):
+        found_outliers = True
+        ts = ts_list[i]
+        ts_str = fmt_ts(ts) if ts is not None else f"run #{i+1}"
+        run_outliers.sort(key=lambda x: x[0], reverse=True)
+        out.extend(
+            outlier_fmt(run=i + 1, ts=ts_str, phase=phase, duration=duration, mean=mean, z=z)
+            for z, phase, duration, mean in run_outliers
+        )
     if not found_outliers:
-        print(f"  None found (all phases within {outlier_z}σ of their mean)")
+        out.append(f"  None found (all phases within {outlier_z}σ of their mean)")
 
     # Most variable phases (potential instability sources)
     noisy = [(cv, phase) for _, phase, _, mean, _, _, _, cv, _ in rows if cv > HIGH_VARIANCE_CV]
     if noisy:
         noisy.sort(reverse=True)
-        print(f"\n=== High-Variance Phases (cv > {HIGH_VARIANCE_CV}) — likely instability sources ===")
+        out.append(f"\n=== High-Variance Phases (cv > {HIGH_VARIANCE_CV}) — likely instability sources ===")
         for cv, phase in noisy:
             vals = phase_data[phase]
-            mn, mx = min(vals), max(vals)
-            print(f"  {phase:<32s} cv={cv:.2f}  range=[{mn:.1f}s, {mx:.1f}s]")
+            mn, mx = (vals.min(), vals.max()) if np is not None else (min(vals), max(vals))
+            out.append(NOISY_FMT.format(phase=phase, cv=cv, mn=mn, mx=mx))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -137,10 +406,14 @@ def main():
     path = DEFAULT_PATH
     outlier_z = DEFAULT_OUTLIER_Z
     last_n = None
+    convert_to = None
 
     i = 0
     while i < len(args):
-        if args[i] == "--last" and i + 1 < len(args):
+        if args[i] == "--convert" and i + 1 < len(args):
+            convert_to = args[i + 1]
+            i += 2
+        elif args[i] == "--last" and i + 1 < len(args):
             last_n = int(args[i + 1])
             i += 2
         elif args[i] == "--outlier" and i + 1 < len(args):
@@ -150,14 +423,13 @@ def main():
             path = args[i]
             i += 1
 
-    records = load_records(path)
-    print(f"Loaded {len(records)} runs from {path}")
-
-    if last_n is not None and last_n < len(records):
-        print(f"Analyzing last {last_n} runs only")
-        records = records[-last_n:]
+    if convert_to is not None:
+        n = convert_jsonl_to_mpk(path, convert_to)
+        print(f"Wrote {n} runs from {path} to {convert_to}")
+        return
 
-    analyze(records, outlier_z)
+    phase_data, total_vals, ts_list, per_run = load_and_bucket(path, last_n)
+    analyze(phase_data, total_vals, ts_list, per_run, outlier_z)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@
  *   KEYS:<string>:<hold_ms>
  *   SPECIAL:<keycode>:<hold_ms>
  *   MOUSE_MOVE:<dx>:<dy>
+ *   MMV:<count>:<dx1>,<dy1>,<dx2>,<dy2>,...
  *   MOUSE_CLICK:<button>:<hold_ms>
  *   MOUSE_DOWN:<button>
  *   MOUSE_UP:<button>
@@ -91,6 +92,8 @@ void processCommand(const char* cmd) {
         handleSpecialKey(args);
     } else if (strcmp(type, "MOUSE_MOVE") == 0) {
         handleMouseMove(args);
+    } else if (strcmp(type, "MMV") == 0) {
+        handleMultiMove(args);
     } else if (strcmp(type, "MOUSE_CLICK") == 0) {
         handleMouseClick(args);
     } else if (strcmp(type, "MOUSE_DOWN") == 0) {
@@ -120,6 +123,14 @@ int parseNextInt(const char** ptr) {
     return val;
 }
 
+// Parse next integer from a comma-separated list, advance pointer
+int parseNextListInt(const char** ptr) {
+    int val = atoi(*ptr);
+    while (**ptr != ',' && **ptr != '\0') (*ptr)++;
+    if (**ptr == ',') (*ptr)++;
+    return val;
+}
+
 // Parse next char from args
 char parseNextChar(const char** ptr) {
     char c = **ptr;
@@ -179,7 +190,22 @@ void handleMouseMove(const char* args) {
     const char* p = args;
     int dx = parseNextInt(&p);
     int dy = parseNextInt(&p);
+    moveStep(dx, dy);
+}
+
+// MMV:<count>:<dx1>,<dy1>,<dx2>,<dy2>,...
+// Whole step chain in one line; each step is replayed like MOUSE_MOVE
+void handleMultiMove(const char* args) {
+    const char* p = args;
+    int count = parseNextInt(&p);
+    for (int i = 0; i < count && *p != '\0'; i++) {
+        int dx = parseNextListInt(&p);
+        int dy = parseNextListInt(&p);
+        moveStep(dx, dy);
+    }
+}
 
+void moveStep(int dx, int dy) {
     // Clamp to signed 8-bit range
     dx = constrain(dx, -127, 127);
     dy = constrain(dy, -127, 127);
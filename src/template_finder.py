@@ -81,13 +81,16 @@ def get_template(key):
     with templates_lock:
         return stored_templates()[key].img_bgr
 
-def _process_template_refs(ref: str | np.ndarray | list[str]) -> list[Template]:
+def _process_template_refs(ref: str | np.ndarray | Template | list) -> list[Template]:
     templates = []
     if type(ref) != list:
         ref = [ref]
     for i in ref:
+        # already resolved, e.g. by search_and_wait before its polling loop
+        if type(i) == Template:
+            templates.append(i)
         # if the reference is a string, then it's a reference to a named template asset
-        if type(i) == str:
+        elif type(i) == str:
             templates.append(stored_templates()[i.upper()])
         # if the reference is an image, append new Template class object
         elif type(i) == np.ndarray:
@@ -199,13 +202,16 @@ def search_and_wait(
     """
     if not suppress_debug:
         Logger.debug(f"Waiting for templates: {ref}")
+    # Resolve templates and config once; each iteration is then one grab + one pass over the templates
+    templates = _process_template_refs(ref)
+    skip_loading_check = "LOADING" in ref
+    loading_black_width = Config().ui_roi["loading_left_black"][2]
     start = time.time()
     template_match = TemplateMatch()
     while (time_remains := time.time() - start < timeout):
         img = grab()
-        is_loading_black_roi = np.average(img[:, 0:Config().ui_roi["loading_left_black"][2]]) < 1.0
-        if not is_loading_black_roi or "LOADING" in ref:
-            template_match = search(ref, img, roi=roi, threshold=threshold, use_grayscale=use_grayscale, color_match=color_match, best_match=best_match)
+        if skip_loading_check or np.average(img[:, 0:loading_black_width]) >= 1.0:
+            template_match = search(templates, img, roi=roi, threshold=threshold, use_grayscale=use_grayscale, color_match=color_match, best_match=best_match)
             if template_match.valid:
                 break
     if not time_remains:
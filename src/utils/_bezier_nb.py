@@ -0,0 +1,45 @@
+"""
+Numba kernels for Humanizer.bezier_points.
+Optional: numba is not a hard requirement, so BEZIER_NB is False when it is missing
+and the humanizer keeps its NumPy basis-matrix path.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+BEZIER_NB = njit is not None
+
+if BEZIER_NB:
+    @njit(cache=True, fastmath=True)
+    def bezier_cubic_nb(sx, sy, cp1x, cp1y, cp2x, cp2y, ex, ey, n, noise_x, noise_y, out):
+        """Fill out[(n+1), 2] (int32) with the noisy cubic curve points."""
+        for i in range(n + 1):
+            t = i / n
+            u = 1.0 - t
+            b0 = u * u * u
+            b1 = 3.0 * u * u * t
+            b2 = 3.0 * u * t * t
+            b3 = t * t * t
+            x = b0 * sx + b1 * cp1x + b2 * cp2x + b3 * ex + noise_x[i]
+            y = b0 * sy + b1 * cp1y + b2 * cp2y + b3 * ey + noise_y[i]
+            out[i, 0] = round(x)
+            out[i, 1] = round(y)
+
+    @njit(cache=True, fastmath=True)
+    def bezier_quad_nb(sx, sy, cpx, cpy, ex, ey, n, noise_x, noise_y, out):
+        """Fill out[(n+1), 2] (int32) with the noisy quadratic curve points."""
+        for i in range(n + 1):
+            t = i / n
+            u = 1.0 - t
+            b0 = u * u
+            b1 = 2.0 * u * t
+            b2 = t * t
+            x = b0 * sx + b1 * cpx + b2 * ex + noise_x[i]
+            y = b0 * sy + b1 * cpy + b2 * ey + noise_y[i]
+            out[i, 0] = round(x)
+            out[i, 1] = round(y)
+else:
+    bezier_cubic_nb = None
+    bezier_quad_nb = None
@@ -3,6 +3,9 @@ Arduino HID Interface - Serial communication with Arduino Leonardo/Pro Micro.
 Sends commands that the Arduino converts to real USB HID keyboard/mouse events.
 """
 
+import os
+import queue
+import threading
 import time
 import serial
 import serial.tools.list_ports
@@ -46,6 +49,43 @@ SPECIAL_KEYS = {
     'f12': 205,
 }
 
+# Max steps per MMV frame so a line stays within the firmware's 128-byte buffer
+MULTI_MOVE_MAX_STEPS = 10
+
+# Wire bytes per (command, *args), built on first use
+_ENCODED_CMD_CACHE: dict[tuple, bytes] = {}
+
+
+def _encode_cmd(*parts) -> bytes:
+    """Return the newline-terminated ASCII bytes for a command, memoized."""
+    cmd = _ENCODED_CMD_CACHE.get(parts)
+    if cmd is None:
+        cmd = _ENCODED_CMD_CACHE[parts] = (":".join(map(str, parts)) + "\n").encode('ascii')
+    return cmd
+
+
+def encode_key_press(key: str, hold_ms: int = 50) -> bytes | None:
+    """Wire bytes to press and release `key`, or None if the key is unknown."""
+    key_lower = key.lower()
+    if key_lower in SPECIAL_KEYS:
+        return _encode_cmd("SPECIAL", SPECIAL_KEYS[key_lower], hold_ms)
+    if len(key) == 1:
+        return _encode_cmd("KEY", key, hold_ms)
+    return None
+
+
+def encode_key_event(kind: str, key: str) -> bytes | None:
+    """Wire bytes for a KEY_DOWN/KEY_UP of `key`, or None if the key is unknown.
+
+    Special keys are sent as their raw keycode byte, which the firmware reads as the key char.
+    """
+    if len(key) == 1:
+        return _encode_cmd(kind, key)
+    keycode = SPECIAL_KEYS.get(key.lower())
+    if keycode is not None:
+        return b"%s:%c\n" % (kind.encode('ascii'), keycode)
+    return None
+
 
 class ArduinoHID:
     def __init__(self, port='COM3', baud=115200, timeout=1.0):
@@ -54,6 +94,22 @@ class ArduinoHID:
         self.timeout = timeout
         self.serial = None
         self.connected = False
+        # _send is rebound to _send_connected/_send_disconnected on every state change
+        self._send = self._send_disconnected
+        # Raw fd for hot-path writes (None where pyserial has no fileno, e.g. Windows)
+        self._fd = None
+        # The Arduino replies to every command. A reader thread pushes replies onto
+        # _cq; _outstanding counts commands whose reply hasn't been reaped yet.
+        self._cq = queue.Queue()
+        self._reader = None
+        self._outstanding = 0
+        self._outstanding_max = 16
+        # Replies still owed by commands whose reply timed out. The firmware answers
+        # every command in order, so these arrive late and must not be credited to
+        # later commands; the reader drops them. Guarded by _late_lock.
+        self._late = 0
+        self._late_lock = threading.Lock()
+        self._lock = threading.RLock()
 
     def connect(self) -> bool:
         """Connect to the Arduino. Returns True on success."""
@@ -67,12 +123,21 @@ class ArduinoHID:
             time.sleep(2.0)
             # Flush any startup messages
             self.serial.reset_input_buffer()
-            self.connected = True
+            try:
+                self._fd = self.serial.fileno()
+            except (AttributeError, OSError):
+                self._fd = None
+            self._cq = queue.Queue()
+            self._outstanding = 0
+            self._late = 0
+            self._set_connected(True)
+            self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader.start()
             Logger.info(f"Connected to Arduino on {self.port}")
             return True
         except serial.SerialException as e:
             Logger.error(f"Failed to connect to Arduino on {self.port}: {e}")
-            self.connected = False
+            self._set_connected(False)
             return False
 
     def disconnect(self):
@@ -80,70 +145,193 @@ class ArduinoHID:
         if self.serial and self.serial.is_open:
             try:
                 self._send("PING")
+                self._set_connected(False)
                 self.serial.close()
             except Exception:
                 pass
-        self.connected = False
+        self._fd = None
+        self._set_connected(False)
         Logger.info("Disconnected from Arduino")
 
-    def _send(self, command: str, wait_ack=True) -> bool:
-        """Send a command to the Arduino. Returns True if acknowledged."""
-        if not self.connected or not self.serial or not self.serial.is_open:
-            Logger.warning(f"Cannot send command, not connected: {command}")
-            return False
+    def _reader_loop(self):
+        """Read replies off the port and queue them for _send/sync to reap in order."""
+        readline = self.serial.readline
+        while self.connected:
+            try:
+                line = readline()
+            except (serial.SerialException, OSError, TypeError):
+                # Port closed underneath us
+                break
+            if not line:
+                continue
+            response = line.decode('ascii', errors='replace').strip()
+            if response == 'SAFETY':
+                # Unsolicited watchdog notice, not a reply to any command
+                Logger.warning("Arduino safety timeout triggered")
+                continue
+            with self._late_lock:
+                if self._late > 0:
+                    # Reply to a command _reap already gave up on
+                    self._late -= 1
+                    if response.startswith('ERR'):
+                        Logger.error(f"Arduino error (late reply): {response}")
+                    continue
+                self._cq.put(response)
+
+    def _set_connected(self, connected: bool):
+        """Update the connection state and bind the matching _send implementation."""
+        self.connected = connected
+        self._send = self._send_connected if connected else self._send_disconnected
+
+    def _send_disconnected(self, command: str | bytes, wait_ack=True) -> bool:
+        Logger.warning(f"Cannot send command, not connected: {command}")
+        return False
+
+    def _send_connected(self, command: str | bytes, wait_ack=True) -> bool:
+        """Send a command to the Arduino. Returns True if acknowledged.
+
+        Bound as `_send` while connected, so the port is assumed open; a serial
+        error drops back to the disconnected state.
+        `command` is either a string without the trailing newline or the
+        pre-encoded wire bytes from `_encode_cmd`.
+        """
+        payload = command if isinstance(command, bytes) else f"{command}\n".encode('ascii')
+        with self._lock:
+            if not wait_ack and self._outstanding >= self._outstanding_max:
+                # Don't run too far ahead of the Arduino
+                self.sync()
 
+            self._outstanding += 1
+            try:
+                # No flush(): it blocks until USB completes, and reaping the reply
+                # below already waits for the Arduino when we need an answer
+                self._write(payload)
+            except OSError as e:
+                # SerialException is an OSError, as is a failed os.write on a dead fd
+                Logger.error(f"Serial error sending command: {e}")
+                self._set_connected(False)
+                return False
+
+            if not wait_ack:
+                return True
+            # Our reply is the last one outstanding
+            response = None
+            while self._outstanding > 0:
+                response = self._reap()
+                if response is None:
+                    break
+                if self._outstanding > 0 and response.startswith('ERR'):
+                    Logger.error(f"Arduino error: {response}")
+            if response == 'OK':
+                return True
+            elif response is not None and response.startswith('ERR'):
+                Logger.error(f"Arduino error: {response}")
+                return False
+            else:
+                Logger.debug(f"Unexpected response: {response}")
+                return True  # Don't fail on unexpected responses
+
+    def send_batch(self, commands: list[str | bytes], wait_ack=False) -> bool:
+        """Send several commands in a single write instead of one write per command.
+
+        With wait_ack, waits for all of their replies (see sync()). Returns False on a
+        serial error or, with wait_ack, if any command was rejected.
+        """
+        payloads = [c if isinstance(c, bytes) else f"{c}\n".encode('ascii') for c in commands]
+        if not self.connected:
+            return self._send(b"".join(payloads), wait_ack=wait_ack)
+        with self._lock:
+            # At most _outstanding_max commands per write, so the backpressure bound holds
+            step = self._outstanding_max
+            for start in range(0, len(payloads), step):
+                group = payloads[start:start + step]
+                if self._outstanding + len(group) > self._outstanding_max:
+                    self.sync()
+                self._outstanding += len(group)
+                try:
+                    self._write(b"".join(group))
+                except OSError as e:
+                    Logger.error(f"Serial error sending commands: {e}")
+                    self._set_connected(False)
+                    return False
+            return self.sync() if wait_ack else True
+
+    def _write(self, buf: bytes):
+        """Write to the port, bypassing pyserial's per-call overhead when the fd is available."""
+        if self._fd is None:
+            self.serial.write(buf)
+            return
+        try:
+            written = os.write(self._fd, buf)
+        except BlockingIOError:
+            written = 0
+        if written < len(buf):
+            # pyserial keeps the fd non-blocking; let it wait out a full kernel buffer
+            self.serial.write(buf[written:])
+
+    def _reap(self) -> str | None:
+        """Pop the oldest outstanding reply. Returns None if it never arrived."""
         try:
-            self.serial.write(f"{command}\n".encode('ascii'))
-            self.serial.flush()
-
-            if wait_ack:
-                response = self.serial.readline().decode('ascii').strip()
-                if response == 'OK':
-                    return True
-                elif response == 'SAFETY':
-                    Logger.warning("Arduino safety timeout triggered")
+            response = self._cq.get(timeout=self.timeout)
+        except queue.Empty:
+            # Stop waiting, but keep count: anything that slipped into the queue since
+            # the timeout is dropped now, and the reader drops the rest as they arrive
+            with self._late_lock:
+                while self._outstanding > 0:
+                    try:
+                        self._cq.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._outstanding -= 1
+                self._late += self._outstanding
+                self._outstanding = 0
+            return None
+        self._outstanding -= 1
+        return response
+
+    def sync(self) -> bool:
+        """Barrier: wait until the Arduino has processed every command sent so far."""
+        with self._lock:
+            ok = True
+            while self._outstanding > 0:
+                response = self._reap()
+                if response is None:
                     return False
-                elif response.startswith('ERR'):
+                if response.startswith('ERR'):
                     Logger.error(f"Arduino error: {response}")
-                    return False
-                else:
-                    Logger.debug(f"Unexpected response: {response}")
-                    return True  # Don't fail on unexpected responses
-            return True
-        except serial.SerialException as e:
-            Logger.error(f"Serial error sending command: {e}")
-            self.connected = False
-            return False
+                    ok = False
+            return ok
+
+    def send_raw(self, command: str | bytes, wait_ack=True) -> bool:
+        """Send a pre-built command, e.g. wire bytes from encode_key_press/encode_key_event.
+
+        Returns True if acknowledged (or sent, when wait_ack is False).
+        """
+        return self._send(command, wait_ack=wait_ack)
 
     def key_press(self, key: str, hold_ms: int = 50):
         """Press and release a key. Handles both regular and special keys."""
-        key_lower = key.lower()
-        if key_lower in SPECIAL_KEYS:
-            self.special_key(SPECIAL_KEYS[key_lower], hold_ms)
-        elif len(key) == 1:
-            self._send(f"KEY:{key}:{hold_ms}")
+        cmd = encode_key_press(key, hold_ms)
+        if cmd is not None:
+            self._send(cmd)
         else:
             Logger.warning(f"Unknown key: {key}")
 
     def key_down(self, key: str):
         """Press and hold a key."""
-        key_lower = key.lower()
-        if len(key) == 1:
-            self._send(f"KEY_DOWN:{key}")
-        elif key_lower in SPECIAL_KEYS:
-            self._send(f"KEY_DOWN:{chr(SPECIAL_KEYS[key_lower])}")
+        cmd = encode_key_event("KEY_DOWN", key)
+        if cmd is not None:
+            self._send(cmd)
 
-    def key_up(self, key: str):
+    def key_up(self, key: str, wait_ack=True):
         """Release a held key."""
-        key_lower = key.lower()
-        if len(key) == 1:
-            self._send(f"KEY_UP:{key}")
-        elif key_lower in SPECIAL_KEYS:
-            self._send(f"KEY_UP:{chr(SPECIAL_KEYS[key_lower])}")
+        cmd = encode_key_event("KEY_UP", key)
+        if cmd is not None:
+            self._send(cmd, wait_ack=wait_ack)
 
     def special_key(self, keycode: int, hold_ms: int = 50):
         """Press a special key by Arduino keycode."""
-        self._send(f"SPECIAL:{keycode}:{hold_ms}")
+        self._send(_encode_cmd("SPECIAL", keycode, hold_ms))
 
     def mouse_move_relative(self, dx: int, dy: int, wait_ack=False):
         """Send a single relative mouse movement step. Clamped to [-127, 127]."""
@@ -151,20 +339,34 @@ class ArduinoHID:
         dy = max(-127, min(127, dy))
         self._send(f"MOUSE_MOVE:{dx}:{dy}", wait_ack=wait_ack)
 
+    def mouse_move_path(self, deltas: list[tuple[int, int]], wait_ack=False):
+        """Send a chain of relative steps as MMV frames instead of one MOUSE_MOVE per step.
+        Each step is clamped to [-127, 127]."""
+        if len(deltas) == 1:
+            self.mouse_move_relative(*deltas[0], wait_ack=wait_ack)
+            return
+        frames = []
+        for i in range(0, len(deltas), MULTI_MOVE_MAX_STEPS):
+            chunk = deltas[i:i + MULTI_MOVE_MAX_STEPS]
+            flat = ",".join(f"{max(-127, min(127, dx))},{max(-127, min(127, dy))}" for dx, dy in chunk)
+            frames.append(f"MMV:{len(chunk)}:{flat}")
+        # All frames of the path leave in one write
+        self.send_batch(frames, wait_ack=wait_ack)
+
     def mouse_click(self, button: str = 'left', hold_ms: int = 50):
         """Click a mouse button."""
         btn_code = 2 if button == 'right' else (3 if button == 'middle' else 1)
-        self._send(f"MOUSE_CLICK:{btn_code}:{hold_ms}")
+        self._send(_encode_cmd("MOUSE_CLICK", btn_code, hold_ms))
 
     def mouse_down(self, button: str = 'left'):
         """Press and hold a mouse button."""
         btn_code = 2 if button == 'right' else (3 if button == 'middle' else 1)
-        self._send(f"MOUSE_DOWN:{btn_code}")
+        self._send(_encode_cmd("MOUSE_DOWN", btn_code))
 
     def mouse_up(self, button: str = 'left'):
         """Release a mouse button."""
         btn_code = 2 if button == 'right' else (3 if button == 'middle' else 1)
-        self._send(f"MOUSE_UP:{btn_code}")
+        self._send(_encode_cmd("MOUSE_UP", btn_code))
 
     def type_string(self, text: str, hold_ms: int = 30):
         """Type a string character by character."""
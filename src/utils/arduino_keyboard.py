@@ -11,8 +11,9 @@ Usage (in main.py, before any game logic):
     install_arduino_keyboard(arduino_hid_instance)
 """
 
+import string
 import keyboard
-from utils.arduino_hid import ArduinoHID, SPECIAL_KEYS
+from utils.arduino_hid import ArduinoHID, SPECIAL_KEYS, encode_key_press, encode_key_event
 from logger import Logger
 
 # Keep references to originals
@@ -23,6 +24,18 @@ _original_release = keyboard.release
 # Arduino HID instance (set by install)
 _arduino: ArduinoHID = None
 
+# Map keyboard lib names to our SPECIAL_KEYS names
+_key_map = {
+    'shift': 'left_shift',
+    'ctrl': 'left_ctrl',
+    'alt': 'left_alt',
+    'space': ' ',
+    'spacebar': ' ',
+}
+
+# Raw hotkey string -> translated key name
+_translate_cache: dict[str, str] = {}
+
 
 def _translate_key(key: str) -> str:
     """Normalize key names between keyboard lib and Arduino conventions.
@@ -30,16 +43,30 @@ def _translate_key(key: str) -> str:
     keyboard lib uses names like 'esc', 'enter', 'shift', 'alt', etc.
     Our Arduino HID expects these mapped through SPECIAL_KEYS.
     """
-    # Map keyboard lib names to our SPECIAL_KEYS names
-    key_map = {
-        'shift': 'left_shift',
-        'ctrl': 'left_ctrl',
-        'alt': 'left_alt',
-        'space': ' ',
-        'spacebar': ' ',
-    }
-    key_lower = key.lower().strip()
-    return key_map.get(key_lower, key_lower)
+    translated = _translate_cache.get(key)
+    if translated is None:
+        key_lower = key.lower().strip()
+        translated = _translate_cache[key] = _key_map.get(key_lower, key_lower)
+    return translated
+
+
+def _build_hotkey_tables() -> tuple[dict[str, bytes], dict[str, bytes], dict[str, bytes]]:
+    """Map lowercased keyboard-lib names straight to pre-encoded press/down/up commands."""
+    names = [*SPECIAL_KEYS, *_key_map, *(string.ascii_lowercase + string.digits + string.punctuation)]
+    to_cmd, to_down, to_up = {}, {}, {}
+    for name in names:
+        key = _translate_key(name)
+        if (cmd := encode_key_press(key)) is not None:
+            to_cmd[name] = cmd
+        if (cmd := encode_key_event("KEY_DOWN", key)) is not None:
+            to_down[name] = cmd
+        if (cmd := encode_key_event("KEY_UP", key)) is not None:
+            to_up[name] = cmd
+    return to_cmd, to_down, to_up
+
+
+# Fast path for the default hold time; anything missing goes through _translate_key
+_HOTKEY_TO_CMD, _HOTKEY_TO_DOWN, _HOTKEY_TO_UP = _build_hotkey_tables()
 
 
 def _arduino_send(hotkey, do_press=True, do_release=True):
@@ -54,17 +81,30 @@ def _arduino_send(hotkey, do_press=True, do_release=True):
         _original_send(hotkey, do_press=do_press, do_release=do_release)
         return
 
-    key = _translate_key(str(hotkey))
+    hotkey = str(hotkey)
+    name = hotkey.lower().strip()
 
     if do_press and do_release:
         # Normal key press + release
-        _arduino.key_press(key, hold_ms=50)
+        cmd = _HOTKEY_TO_CMD.get(name)
+        if cmd is not None:
+            _arduino.send_raw(cmd)
+        else:
+            _arduino.key_press(_translate_key(hotkey), hold_ms=50)
     elif do_press and not do_release:
         # Hold key down
-        _arduino.key_down(key)
+        cmd = _HOTKEY_TO_DOWN.get(name)
+        if cmd is not None:
+            _arduino.send_raw(cmd)
+        else:
+            _arduino.key_down(_translate_key(hotkey))
     elif not do_press and do_release:
-        # Release held key
-        _arduino.key_up(key)
+        # Release held key; fire-and-forget like _arduino_release
+        cmd = _HOTKEY_TO_UP.get(name)
+        if cmd is not None:
+            _arduino.send_raw(cmd, wait_ack=False)
+        else:
+            _arduino.key_up(_translate_key(hotkey), wait_ack=False)
 
 
 def _arduino_press(hotkey):
@@ -73,8 +113,12 @@ def _arduino_press(hotkey):
         _original_press(hotkey)
         return
 
-    key = _translate_key(str(hotkey))
-    _arduino.key_down(key)
+    hotkey = str(hotkey)
+    cmd = _HOTKEY_TO_DOWN.get(hotkey.lower().strip())
+    if cmd is not None:
+        _arduino.send_raw(cmd)
+    else:
+        _arduino.key_down(_translate_key(hotkey))
 
 
 def _arduino_release(hotkey):
@@ -83,8 +127,13 @@ def _arduino_release(hotkey):
         _original_release(hotkey)
         return
 
-    key = _translate_key(str(hotkey))
-    _arduino.key_up(key)
+    # Nothing waits on a release; its ACK is reaped by the next acknowledged command
+    hotkey = str(hotkey)
+    cmd = _HOTKEY_TO_UP.get(hotkey.lower().strip())
+    if cmd is not None:
+        _arduino.send_raw(cmd, wait_ack=False)
+    else:
+        _arduino.key_up(_translate_key(hotkey), wait_ack=False)
 
 
 def install_arduino_keyboard(arduino_hid: ArduinoHID):
@@ -7,12 +7,16 @@ The public API (mouse.move, mouse.click, mouse.press, mouse.release,
 mouse.get_position, mouse.wheel) is unchanged.
 """
 
+import functools
 import random
 import math
 import time
+import threading
 import ctypes
 from ctypes import wintypes
 
+import numpy as np
+
 import screen
 from config import Config
 from utils.misc import is_in_roi
@@ -21,11 +25,32 @@ import template_finder
 
 # Arduino HID backend (set by initialize_arduino())
 _arduino = None
+# Bound ArduinoHID methods (set by initialize_arduino())
+_move_path_fn = _click_fn = _down_fn = _up_fn = None
 # Humanizer for Bezier curves and timing (set by initialize_arduino())
 _humanizer = None
 # Software fallback
 _software_mouse = None
 
+# Target jitter for mouse.move and _move_arduino
+_rng = np.random.default_rng()
+
+# GetCursorPos bound on first use with an explicit prototype, writing into one shared POINT.
+# Binding lazily keeps this module importable off Windows (tests, tooling).
+_GetCursorPos = None
+_cursor_point = wintypes.POINT()
+_cursor_lock = threading.Lock()
+
+# Seconds an "is the inventory open" answer stays valid for clicks in the same guarded area
+INVENTORY_CHECK_TTL = 0.2
+# Seconds an answer stays valid when the gold button region's pixels are unchanged
+INVENTORY_FRAME_TTL = 0.5
+# [checked_at, area, is_inventory_open, gold_btn_region_fingerprint]
+_last_inventory_check = [0.0, None, False, None]
+
+# Coalesce path points into one Arduino write per this many seconds of movement
+HID_BATCH_INTERVAL = 0.008
+
 def _init_software_fallback():
     """Lazy-load the software mouse library as fallback."""
     global _software_mouse
@@ -43,9 +68,15 @@ def initialize_arduino(arduino_hid=None, humanizer=None):
         arduino_hid: Connected ArduinoHID instance (or None to use software fallback)
         humanizer: Humanizer instance for Bezier curves and timing
     """
-    global _arduino, _humanizer
+    global _arduino, _humanizer, _move_path_fn, _click_fn, _down_fn, _up_fn
     _arduino = arduino_hid
     _humanizer = humanizer
+    if _arduino is not None:
+        # Bound once here so the hot paths call a module global, not an attribute chain
+        _move_path_fn = _arduino.mouse_move_path
+        _click_fn = _arduino.mouse_click
+        _down_fn = _arduino.mouse_down
+        _up_fn = _arduino.mouse_up
     if _arduino and _arduino.connected:
         Logger.info("Mouse routing through Arduino HID")
     else:
@@ -56,40 +87,121 @@ def _use_arduino() -> bool:
     """Check if Arduino is connected and should be used."""
     return _arduino is not None and _arduino.connected
 
+@functools.lru_cache(maxsize=1)
+def _click_guard_rois() -> tuple:
+    """(gold_btn, equipped_inventory_area, restricted_inventory_area) ROIs, read from Config once."""
+    ui_roi = Config().ui_roi
+    return ui_roi["gold_btn"], ui_roi["equipped_inventory_area"], ui_roi["restricted_inventory_area"]
+
+def _search_inventory_open(area: str, now: float, gold_btn_roi) -> bool:
+    """Template-search for an open inventory. Rapid click bursts into the same guarded
+    area reuse a recent answer instead of re-grabbing, and a frame whose gold button
+    region is pixel-identical to the last checked one skips the template match."""
+    checked_at, checked_area, is_inventory_open, fingerprint = _last_inventory_check
+    if checked_area == area and now - checked_at < INVENTORY_CHECK_TTL:
+        return is_inventory_open
+    img = screen.grab()
+    x, y, w, h = gold_btn_roi
+    region_fingerprint = hash(img[y:y + h, x:x + w].tobytes())
+    if region_fingerprint != fingerprint or now - checked_at >= INVENTORY_FRAME_TTL:
+        is_inventory_open = template_finder.search(
+            "INVENTORY_GOLD_BTN",
+            img,
+            threshold=0.8,
+            roi=gold_btn_roi,
+            use_grayscale=True
+        ).valid
+    _last_inventory_check[:] = [now, area, is_inventory_open, region_fingerprint]
+    return is_inventory_open
+
 def _get_cursor_pos() -> tuple[int, int]:
     """Get current cursor position via Windows API (works regardless of input method)."""
-    point = wintypes.POINT()
-    ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
-    return (point.x, point.y)
+    global _GetCursorPos
+    with _cursor_lock:
+        if _GetCursorPos is None:
+            get_cursor_pos = ctypes.WinDLL("user32").GetCursorPos
+            get_cursor_pos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+            get_cursor_pos.restype = wintypes.BOOL
+            _GetCursorPos = get_cursor_pos
+        _GetCursorPos(_cursor_point)
+        return (_cursor_point.x, _cursor_point.y)
 
-def _move_arduino(from_x, from_y, to_x, to_y, delay_factor):
-    """Move mouse from (from_x, from_y) to (to_x, to_y) via Arduino relative steps."""
+def _move_arduino(from_x, from_y, to_x, to_y, delay_factor, end_jitter: tuple[int, int] = (0, 0)):
+    """Move mouse from (from_x, from_y) to (to_x, to_y) via Arduino relative steps.
+    end_jitter is the (rx, ry) uniform pixel jitter on where the path ends."""
     dist = math.sqrt((to_x - from_x) ** 2 + (to_y - from_y) ** 2)
 
-    # Generate Bezier curve path
-    points = _humanizer.bezier_points((from_x, from_y), (to_x, to_y))
+    if dist < 20:
+        # Short hop: a straight line in 1-3 sub-steps, no Bezier curve needed
+        jitter_x, jitter_y = end_jitter
+        if jitter_x or jitter_y:
+            ux, uy = _rng.random(2).tolist()
+            to_x += int(ux * 2 * jitter_x) - jitter_x
+            to_y += int(uy * 2 * jitter_y) - jitter_y
+        dx, dy = int(to_x - from_x), int(to_y - from_y)
+        n = random.randint(1, 3)
+        steps = [(dx * (i + 1) // n - dx * i // n, dy * (i + 1) // n - dy * i // n) for i in range(n)]
+        steps = [step for step in steps if step != (0, 0)]
+        if steps:
+            _move_path_fn(steps)
+        time.sleep(random.uniform(0.01, 0.03))
+        return
 
     # Total movement duration (matches botty's original timing)
     duration = min(0.5, max(0.05, dist * 0.0004) * random.uniform(delay_factor[0], delay_factor[1]))
+
+    # Generate Bezier curve path, one point per HID polling interval of that duration
+    points = _humanizer.bezier_points((from_x, from_y), (to_x, to_y), end_jitter=end_jitter, duration=duration)
     step_delay = duration / max(len(points), 1)
+    # Points whose deadlines fall inside one HID batch interval go out as a single write
+    per_batch = max(1, int(HID_BATCH_INTERVAL / step_delay)) if step_delay > 0 else len(points)
+
+    # Per-point relative deltas in one array op; the common case needs no splitting
+    deltas = np.diff(np.array(points, dtype=np.int32), axis=0,
+                     prepend=np.array([[from_x, from_y]], dtype=np.int32))
+    if np.abs(deltas).max() > 127:
+        deltas, bounds = _split_large_deltas(deltas)
+    else:
+        bounds = None
+
+    # Walk the Bezier path, sending relative deltas to Arduino. Pacing is against absolute
+    # deadlines so sleep overshoot (15.6ms scheduler quantum on Windows) doesn't accumulate.
+    send = _move_path_fn
+    t0 = time.perf_counter()
+    n = len(points)
+    for start in range(0, n, per_batch):
+        end = min(start + per_batch, n)
+        lo, hi = (start, end) if bounds is None else (bounds[start], bounds[end])
+        chunk = deltas[lo:hi]
+        chunk = chunk[chunk.any(axis=1)]
+        if len(chunk):
+            send(chunk.tolist())
+        _wait_until(t0 + end * step_delay)
 
-    # Walk the Bezier path, sending relative deltas to Arduino
-    prev_x, prev_y = from_x, from_y
-    for px, py in points:
-        dx = int(px - prev_x)
-        dy = int(py - prev_y)
 
-        # Break large deltas into Arduino's +-127 range
-        while abs(dx) > 0 or abs(dy) > 0:
+def _split_large_deltas(deltas: np.ndarray) -> tuple[np.ndarray, list[int]]:
+    """Break deltas into Arduino's +-127 range. Returns (steps, bounds), where the steps
+    for point i are steps[bounds[i]:bounds[i + 1]]."""
+    steps = []
+    bounds = [0]
+    for dx, dy in deltas.tolist():
+        while dx or dy:
             step_dx = max(-127, min(127, dx))
             step_dy = max(-127, min(127, dy))
-            _arduino.mouse_move_relative(step_dx, step_dy)
+            steps.append((step_dx, step_dy))
             dx -= step_dx
             dy -= step_dy
+        bounds.append(len(steps))
+    return np.array(steps, dtype=np.int32).reshape(-1, 2), bounds
 
-        prev_x, prev_y = px, py
-        time.sleep(step_delay)
 
+def _wait_until(deadline: float):
+    """Sleep until just before deadline, then spin the rest for sub-quantum accuracy."""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < deadline:
+        pass
 
 class mouse:
     @staticmethod
@@ -100,6 +212,7 @@ class mouse:
             x, y: Target position in monitor (absolute screen) coordinates
             absolute: If True, x/y are absolute; if False, relative to current
             randomize: Pixel jitter to add to target. Int for uniform, tuple for (x, y) range.
+                With Arduino it's drawn as the Bezier path's end point rather than up front.
             delay_factor: Speed multiplier range [min, max]
         """
         from_point = mouse.get_position()
@@ -108,43 +221,44 @@ class mouse:
             x = from_point[0] + x
             y = from_point[1] + y
 
-        # Apply randomization jitter to target
-        if type(randomize) is int:
-            randomize = int(randomize)
-            if randomize > 0:
-                x = int(x) + random.randrange(-randomize, +randomize)
-                y = int(y) + random.randrange(-randomize, +randomize)
+        # Randomization jitter on the target
+        if isinstance(randomize, int):
+            rx = ry = randomize
         else:
-            randomize = (int(randomize[0]), int(randomize[1]))
-            if randomize[1] > 0 and randomize[0] > 0:
-                x = int(x) + random.randrange(-randomize[0], +randomize[0])
-                y = int(y) + random.randrange(-randomize[1], +randomize[1])
+            rx, ry = int(randomize[0]), int(randomize[1])
+        rx, ry = max(0, rx), max(0, ry)
+        x, y = int(x), int(y)
 
         if _use_arduino():
-            _move_arduino(from_point[0], from_point[1], int(x), int(y), delay_factor)
+            # The jittered target is drawn along with the Bezier path's own randomness
+            _move_arduino(from_point[0], from_point[1], x, y, delay_factor, (rx, ry))
         else:
             _init_software_fallback()
             if _software_mouse:
+                if rx > 0:
+                    x += int(_rng.integers(-rx, rx))
+                if ry > 0:
+                    y += int(_rng.integers(-ry, ry))
                 # Use original botty movement via software mouse
                 _software_mouse.move(int(x), int(y))
 
     @staticmethod
     def _is_clicking_safe():
         """Check if inventory is open and prevent clicks in equipped area."""
+        gold_btn_roi, equipped_roi, restricted_roi = _click_guard_rois()
         mouse_pos = screen.convert_monitor_to_screen(mouse.get_position())
-        is_inventory_open = template_finder.search(
-            "INVENTORY_GOLD_BTN",
-            screen.grab(),
-            threshold=0.8,
-            roi=Config().ui_roi["gold_btn"],
-            use_grayscale=True
-        ).valid
-        if is_inventory_open:
-            is_in_equipped_area = is_in_roi(Config().ui_roi["equipped_inventory_area"], mouse_pos)
-            is_in_restricted_inventory_area = is_in_roi(Config().ui_roi["restricted_inventory_area"], mouse_pos)
-            if is_in_restricted_inventory_area or is_in_equipped_area:
-                Logger.error("Mouse wants to click in equipped area. Cancel action.")
-                return False
+        # Most clicks land in the game world: only look for an open inventory
+        # when the click would actually hit one of the guarded areas
+        if is_in_roi(restricted_roi, mouse_pos):
+            area = "restricted"
+        elif is_in_roi(equipped_roi, mouse_pos):
+            area = "equipped"
+        else:
+            return True
+        # Always decided from the screen: many paths open/close panels without telling us
+        if _search_inventory_open(area, time.perf_counter(), gold_btn_roi):
+            Logger.error("Mouse wants to click in equipped area. Cancel action.")
+            return False
         return True
 
     @staticmethod
@@ -153,7 +267,7 @@ class mouse:
         if button != "left" or mouse._is_clicking_safe():
             if _use_arduino():
                 hold_ms = max(30, int(random.gauss(60, 15)))
-                _arduino.mouse_click(button, hold_ms)
+                _click_fn(button, hold_ms)
             else:
                 _init_software_fallback()
                 if _software_mouse:
@@ -164,7 +278,7 @@ class mouse:
         """Press and hold a mouse button."""
         if button != "left" or mouse._is_clicking_safe():
             if _use_arduino():
-                _arduino.mouse_down(button)
+                _down_fn(button)
             else:
                 _init_software_fallback()
                 if _software_mouse:
@@ -174,7 +288,7 @@ class mouse:
     def release(button):
         """Release a mouse button."""
         if _use_arduino():
-            _arduino.mouse_up(button)
+            _up_fn(button)
         else:
             _init_software_fallback()
             if _software_mouse:
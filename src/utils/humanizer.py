@@ -7,7 +7,9 @@ This is the most critical module for avoiding detection.
 import math
 import random
 import time
+import numpy as np
 from logger import Logger
+from utils._bezier_nb import BEZIER_NB, bezier_cubic_nb, bezier_quad_nb
 
 # Action delay profiles: (base_ms, variance_ms)
 ACTION_DELAYS = {
@@ -23,6 +25,36 @@ ACTION_DELAYS = {
     'skill_select': (150, 50),
 }
 
+# Effective HID polling rate of the Arduino mouse endpoint (reports/s)
+HID_POLL_HZ = 125
+
+# Shared generator for per-point curve noise
+_rng = np.random.default_rng()
+
+# Bernstein basis matrices keyed by num_points: rows are t in [0, 1], columns the weights
+_CUBIC_BASIS_CACHE: dict[int, np.ndarray] = {}
+_QUAD_BASIS_CACHE: dict[int, np.ndarray] = {}
+
+
+def _cubic_basis(n: int) -> np.ndarray:
+    basis = _CUBIC_BASIS_CACHE.get(n)
+    if basis is None:
+        t = np.linspace(0.0, 1.0, n + 1)
+        u = 1.0 - t
+        basis = np.stack([u**3, 3 * u * u * t, 3 * u * t * t, t**3], axis=1)
+        _CUBIC_BASIS_CACHE[n] = basis
+    return basis
+
+
+def _quad_basis(n: int) -> np.ndarray:
+    basis = _QUAD_BASIS_CACHE.get(n)
+    if basis is None:
+        t = np.linspace(0.0, 1.0, n + 1)
+        u = 1.0 - t
+        basis = np.stack([u * u, 2 * u * t, t * t], axis=1)
+        _QUAD_BASIS_CACHE[n] = basis
+    return basis
+
 
 class Humanizer:
     """All humanization utilities for making bot actions appear natural."""
@@ -52,7 +84,8 @@ class Humanizer:
     # --- Mouse Movement ---
 
     @staticmethod
-    def bezier_points(start: tuple, end: tuple, num_points: int = None) -> list:
+    def bezier_points(start: tuple, end: tuple, num_points: int = None, end_jitter: tuple = (0, 0),
+                      duration: float = None) -> list:
         """Generate points along a Bezier curve from start to end.
 
         Uses 1-2 random control points offset from the straight line
@@ -61,22 +94,39 @@ class Humanizer:
         Args:
             start: (x, y) starting position
             end: (x, y) ending position
-            num_points: Number of points to generate. If None, scales with distance.
+            num_points: Number of points to generate. If None, derived from duration if given,
+                else scaled with distance.
+            end_jitter: (rx, ry) uniform pixel jitter for the end point, drawn with the curve's
+                other random numbers, so callers don't offset the target themselves first.
+            duration: Planned movement time in seconds. Used to emit one point per HID
+                polling interval (HID_POLL_HZ) instead of one per few pixels.
 
         Returns:
             List of (x, y) integer points along the curve.
         """
+        # Every uniform scalar the curve needs, up front in one generator call;
+        # the last two place the end point within end_jitter
+        r = _rng.random(12).tolist()
         sx, sy = start
         ex, ey = end
+        jitter_x, jitter_y = end_jitter
+        ex += int(r[10] * 2 * jitter_x) - jitter_x
+        ey += int(r[11] * 2 * jitter_y) - jitter_y
         distance = math.sqrt((ex - sx) ** 2 + (ey - sy) ** 2)
 
-        if distance < 5:
-            return [end]
+        if distance < 40:
+            # Too short for a visible arc: skip the curve math and jump straight there
+            return [(int(round(sx)), int(round(sy))), (int(round(ex)), int(round(ey)))]
 
-        if num_points is None:
+        if num_points is None and duration is not None:
+            # One point per HID report; more would just get coalesced by the host
+            num_points = max(4, min(100, int(duration * HID_POLL_HZ)))
+        elif num_points is None:
             # Scale points with distance: more points for longer moves
             num_points = max(15, int(distance / 5))
             num_points = min(num_points, 100)
+            # Snap to a multiple of 8 so the cached basis matrices get reused, keeping the 100 cap
+            num_points = min(96, max(16, (num_points + 4) // 8 * 8))
 
         # Direction vector and perpendicular
         dx = ex - sx
@@ -86,63 +136,61 @@ class Humanizer:
         perp_x = -dy / perp_len
         perp_y = dx / perp_len
 
+        # Per-point gaussian jitter (x row, y row) in one more generator call
+        noise_scale = max(1, distance * 0.003)
+        noise = _rng.normal(0.0, noise_scale, (2, num_points + 1))
+
         # Random offset magnitude (10-35% of distance)
-        offset_ratio = random.uniform(0.10, 0.35)
-        offset = distance * offset_ratio
+        offset = distance * (0.10 + 0.25 * r[0])
 
         # Decide between quadratic (1 control point) or cubic (2 control points)
-        use_cubic = distance > 200 or random.random() < 0.3
+        use_cubic = distance > 200 or r[1] < 0.3
 
         if use_cubic:
             # Two control points at ~33% and ~66% along the line
-            t1, t2 = 0.25 + random.uniform(-0.1, 0.1), 0.75 + random.uniform(-0.1, 0.1)
+            t1, t2 = 0.15 + 0.2 * r[2], 0.65 + 0.2 * r[3]
             # Offset in perpendicular direction (same or opposite sides)
-            side1 = random.choice([-1, 1])
-            side2 = side1 if random.random() < 0.6 else -side1
+            side1 = -1 if r[4] < 0.5 else 1
+            side2 = side1 if r[5] < 0.6 else -side1
 
             cp1 = (
-                sx + dx * t1 + perp_x * offset * side1 * random.uniform(0.5, 1.5),
-                sy + dy * t1 + perp_y * offset * side1 * random.uniform(0.5, 1.5),
+                sx + dx * t1 + perp_x * offset * side1 * (0.5 + r[6]),
+                sy + dy * t1 + perp_y * offset * side1 * (0.5 + r[7]),
             )
             cp2 = (
-                sx + dx * t2 + perp_x * offset * side2 * random.uniform(0.3, 1.0),
-                sy + dy * t2 + perp_y * offset * side2 * random.uniform(0.3, 1.0),
+                sx + dx * t2 + perp_x * offset * side2 * (0.3 + 0.7 * r[8]),
+                sy + dy * t2 + perp_y * offset * side2 * (0.3 + 0.7 * r[9]),
             )
 
-            points = []
-            for i in range(num_points + 1):
-                t = i / num_points
-                # Cubic Bezier formula
-                u = 1 - t
-                x = u**3 * sx + 3 * u**2 * t * cp1[0] + 3 * u * t**2 * cp2[0] + t**3 * ex
-                y = u**3 * sy + 3 * u**2 * t * cp1[1] + 3 * u * t**2 * cp2[1] + t**3 * ey
-                # Add gaussian noise
-                noise_scale = max(1, distance * 0.003)
-                x += random.gauss(0, noise_scale)
-                y += random.gauss(0, noise_scale)
-                points.append((int(round(x)), int(round(y))))
+            curve = (float(sx), float(sy), cp1[0], cp1[1], cp2[0], cp2[1], float(ex), float(ey))
         else:
             # Quadratic: one control point at ~50%
-            t_cp = 0.5 + random.uniform(-0.15, 0.15)
-            side = random.choice([-1, 1])
+            t_cp = 0.35 + 0.3 * r[2]
+            side = -1 if r[4] < 0.5 else 1
             cp = (
-                sx + dx * t_cp + perp_x * offset * side * random.uniform(0.7, 1.3),
-                sy + dy * t_cp + perp_y * offset * side * random.uniform(0.7, 1.3),
+                sx + dx * t_cp + perp_x * offset * side * (0.7 + 0.6 * r[6]),
+                sy + dy * t_cp + perp_y * offset * side * (0.7 + 0.6 * r[7]),
             )
 
-            points = []
-            for i in range(num_points + 1):
-                t = i / num_points
-                u = 1 - t
-                x = u**2 * sx + 2 * u * t * cp[0] + t**2 * ex
-                y = u**2 * sy + 2 * u * t * cp[1] + t**2 * ey
-                noise_scale = max(1, distance * 0.003)
-                x += random.gauss(0, noise_scale)
-                y += random.gauss(0, noise_scale)
-                points.append((int(round(x)), int(round(y))))
+            curve = (float(sx), float(sy), cp[0], cp[1], float(ex), float(ey))
+
+        # Output buffer allocated once at its final size; both paths fill it in place
+        pts = np.empty((num_points + 1, 2), dtype=np.int32)
+        if BEZIER_NB:
+            kernel = bezier_cubic_nb if use_cubic else bezier_quad_nb
+            kernel(*curve, num_points, noise[0], noise[1], pts)
+        else:
+            # Control points are (start, cp..., end): x's at even indices, y's at odd
+            basis = _cubic_basis(num_points) if use_cubic else _quad_basis(num_points)
+            ctrl = np.array([curve[0::2], curve[1::2]], dtype=np.float64).T
+            xy = basis @ ctrl
+            xy += noise.T
+            pts[:] = np.rint(xy, out=xy)
 
         # Ensure the last point is exactly the target
-        points[-1] = (int(round(ex)), int(round(ey)))
+        pts[-1] = (round(ex), round(ey))
+        xs, ys = pts.T.tolist()
+        points = list(zip(xs, ys))
         return points
 
     @staticmethod
@@ -1,7 +1,9 @@
+import atexit
 import json
 import os
 import time
 from collections import defaultdict
+from contextlib import contextmanager
 from logger import Logger
 
 TIMING_LOG_PATH = "log/timing/timing.jsonl"
@@ -17,12 +19,16 @@ class RunTimer:
             cls._instance = cls()
         return cls._instance
 
-    def __init__(self):
-        self._active = {}  # phase_name -> start_time
-        self._current_run = {}  # phase_name -> cumulative duration this run
-        self._history = defaultdict(list)  # phase_name -> [durations across runs]
+    def __init__(self, persist_path: str | None = TIMING_LOG_PATH):
+        """persist_path: JSONL file each finished run is appended to, or None to keep timings in memory only."""
+        self._persist_path = persist_path
+        self._persist_fh = None  # kept open for the process lifetime instead of reopening per run
+        # Timing runs on perf_counter_ns (monotonic, integer); seconds only appear in history/output
+        self._active = {}  # phase_name -> start_ns
+        self._current_run = {}  # phase_name -> cumulative duration this run (ns)
+        self._history = defaultdict(list)  # phase_name -> [durations across runs (s)]
         self._run_start = None
-        self._phase_order = []  # track insertion order for display
+        self._phase_order = {}  # phase_name -> None; an insertion-ordered set for display
 
     def start_run(self):
         """Call at the beginning of each run."""
@@ -30,51 +36,66 @@ class RunTimer:
             self._flush_run()
         self._current_run = {}
         self._active = {}
-        self._phase_order = []
-        self._run_start = time.time()
+        self._phase_order = {}
+        self._run_start = time.perf_counter_ns()
 
     def start(self, phase: str):
         """Start timing a named phase."""
-        self._active[phase] = time.time()
+        self._active[phase] = time.perf_counter_ns()
 
     def stop(self, phase: str) -> float:
-        """Stop timing a phase. Returns its duration."""
+        """Stop timing a phase. Returns its duration in seconds."""
         if phase not in self._active:
             return 0
-        duration = time.time() - self._active.pop(phase)
-        self._current_run[phase] = self._current_run.get(phase, 0) + duration
-        if phase not in self._phase_order:
-            self._phase_order.append(phase)
-        return duration
+        duration_ns = time.perf_counter_ns() - self._active.pop(phase)
+        self._record(phase, duration_ns)
+        return duration_ns / 1e9
+
+    @contextmanager
+    def phase(self, phase: str):
+        """Time the enclosed block as a named phase. Recorded on early return or exception too."""
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._record(phase, time.perf_counter_ns() - t0)
+
+    def _record(self, phase: str, duration_ns: int):
+        self._current_run[phase] = self._current_run.get(phase, 0) + duration_ns
+        self._phase_order[phase] = None
 
     def end_run(self):
         """Call at end of run. Logs current run breakdown + running averages."""
         if self._run_start is None:
             return
-        total = time.time() - self._run_start
-        self._current_run["_total"] = total
-        self._persist_run(total)
+        total_ns = time.perf_counter_ns() - self._run_start
+        self._current_run["_total"] = total_ns
+        if self._persist_path is not None:
+            self._persist_run(total_ns)
         self._flush_run()
         self._log_summary()
         self._run_start = None
 
-    def _persist_run(self, total: float):
+    def _persist_run(self, total_ns: int):
         """Append this run's phase timings to the persistent JSONL log."""
         record = {
             "ts": time.time(),
-            "phases": {k: round(v, 3) for k, v in self._current_run.items() if not k.startswith("_")},
-            "total": round(total, 3),
+            "phases": {k: round(v / 1e9, 3) for k, v in self._current_run.items() if not k.startswith("_")},
+            "total": round(total_ns / 1e9, 3),
         }
         try:
-            os.makedirs(os.path.dirname(TIMING_LOG_PATH), exist_ok=True)
-            with open(TIMING_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\n")
+            if self._persist_fh is None:
+                os.makedirs(os.path.dirname(self._persist_path) or ".", exist_ok=True)
+                # Line-buffered, so each run still hits the file as soon as it ends
+                self._persist_fh = open(self._persist_path, "a", buffering=1, encoding="utf-8")
+                atexit.register(self._persist_fh.close)
+            self._persist_fh.write(json.dumps(record) + "\n")
         except Exception as e:
             Logger.warning(f"RunTimer: failed to persist timing data: {e}")
 
     def _flush_run(self):
-        for phase, duration in self._current_run.items():
-            self._history[phase].append(duration)
+        for phase, duration_ns in self._current_run.items():
+            self._history[phase].append(duration_ns / 1e9)
         self._current_run = {}
 
     def _log_summary(self):
@@ -7,9 +7,14 @@ import time
 import random
 import json
 import os
+from collections import deque
 from datetime import datetime
+import numpy as np
 from logger import Logger
 
+# Gaussian draws per refill of the session/break length pools
+POOL_SIZE = 64
+
 
 class SessionManager:
     """Manages play sessions to appear human-like."""
@@ -25,6 +30,11 @@ class SessionManager:
         self.skip_loot_probability = config.get('skip_loot_probability', 0.02)
         self.random_action_probability = config.get('random_action_probability', 0.05)
 
+        # Session/break lengths are drawn in batches and handed out one at a time
+        self._rng = np.random.default_rng()
+        self._session_pool = deque()
+        self._break_pool = deque()
+
         self.session_length_s = self._gaussian_session_length()
         self.break_length_s = self._gaussian_break_length()
 
@@ -110,27 +120,16 @@ class SessionManager:
                      f"{len(items_found)} items found")
 
     def save_log(self):
-        """Save the run log to a JSON file."""
+        """Append the run log to the day's JSONL file (one run per line)."""
         if not self._run_log:
             return
 
         os.makedirs(self.log_dir, exist_ok=True)
         date_str = datetime.now().strftime('%Y%m%d')
-        log_path = os.path.join(self.log_dir, f'runs_{date_str}.json')
-
-        # Append to existing log if it exists
-        existing = []
-        if os.path.exists(log_path):
-            try:
-                with open(log_path, 'r') as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        existing.extend(self._run_log)
+        log_path = os.path.join(self.log_dir, f'runs_{date_str}.jsonl')
 
-        with open(log_path, 'w') as f:
-            json.dump(existing, f, indent=2)
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(entry) + '\n' for entry in self._run_log))
 
         Logger.info(f"Saved {len(self._run_log)} run logs to {log_path}")
         self._run_log.clear()
@@ -151,12 +150,18 @@ class SessionManager:
 
     def _gaussian_session_length(self) -> float:
         """Generate a gaussian-distributed session length in seconds."""
-        minutes = random.gauss(self.avg_session_minutes, self.session_variance_minutes)
+        if not self._session_pool:
+            self._session_pool.extend(
+                self._rng.normal(self.avg_session_minutes, self.session_variance_minutes, POOL_SIZE).tolist())
+        minutes = self._session_pool.popleft()
         minutes = max(30, min(self.avg_session_minutes * 2, minutes))
         return minutes * 60
 
     def _gaussian_break_length(self) -> float:
         """Generate a gaussian-distributed break length in seconds."""
-        minutes = random.gauss(self.avg_break_minutes, self.break_variance_minutes)
+        if not self._break_pool:
+            self._break_pool.extend(
+                self._rng.normal(self.avg_break_minutes, self.break_variance_minutes, POOL_SIZE).tolist())
+        minutes = self._break_pool.popleft()
         minutes = max(5, min(self.avg_break_minutes * 3, minutes))
         return minutes * 60
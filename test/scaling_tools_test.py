@@ -0,0 +1,48 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+import test_resolution_scaling as res_scaling
+
+SCALED_PRESETS = [name for name, (_, _, s) in res_scaling.RESOLUTION_PRESETS.items() if s != 1.0]
+
+
+@pytest.fixture(scope="session")
+def baseline(tmp_path_factory):
+    # Keep the parsed-INI cache out of the user's cache dir
+    cache_dir = res_scaling.INI_CACHE_DIR
+    res_scaling.INI_CACHE_DIR = str(tmp_path_factory.mktemp("ini_cache"))
+    res_scaling.load_game_ini.cache_clear()
+    yield res_scaling.load_game_ini()
+    res_scaling.INI_CACHE_DIR = cache_dir
+
+
+@pytest.fixture(scope="session")
+def decoded_templates():
+    """Every template PNG decoded once and shared across all resolution tests"""
+    pytest.importorskip("cv2")
+    import test_template_scaling as tpl_scaling
+    assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets')
+    return assets_dir, [(p, tpl_scaling.fast_imread(p)) for p in tpl_scaling.collect_pngs(assets_dir)]
+
+
+@pytest.mark.parametrize("res_name", SCALED_PRESETS)
+@pytest.mark.parametrize("check", res_scaling.RESOLUTION_CHECKS, ids=lambda c: c.__name__)
+def test_resolution_scaling(baseline, res_name, check):
+    assert check(res_name) == []
+
+
+@pytest.mark.parametrize("res_name", SCALED_PRESETS)
+def test_template_scaling(decoded_templates, res_name):
+    import test_template_scaling as tpl_scaling
+    assets_dir, templates = decoded_templates
+    scale = tpl_scaling.RESOLUTION_PRESETS[res_name][2]
+    errors = []
+    for png_path, img in templates:
+        _, res_results = tpl_scaling.check_template(png_path, img, [(res_name, scale)], assets_dir)
+        if res_results is None:
+            errors.append(f"Failed to load: {png_path}")
+        elif res_results[res_name][3]:
+            errors.append(res_results[res_name][3])
+    assert errors == []
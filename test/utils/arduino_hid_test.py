@@ -0,0 +1,138 @@
+import queue
+import pytest
+import serial
+from logger import Logger
+from utils import arduino_hid
+from utils.arduino_hid import ArduinoHID
+
+
+class FakeSerial:
+    """Stands in for the Arduino: every written line gets an OK (or ERR for BAD*) reply, in order."""
+
+    def __init__(self, **kwargs):
+        self.is_open = True
+        self.written = []
+        self.writes = 0
+        self.replies = queue.Queue()
+        # While False, replies are held back until release() is called
+        self.auto_reply = True
+        self.held = []
+
+    def fileno(self):
+        raise OSError("no fd")
+
+    def reset_input_buffer(self):
+        pass
+
+    def write(self, buf):
+        self.writes += 1
+        for line in buf.decode('ascii').splitlines():
+            self.written.append(line)
+            reply = "ERR:UNKNOWN_CMD" if line.startswith("BAD") else "OK"
+            if self.auto_reply:
+                self.replies.put(reply)
+            else:
+                self.held.append(reply)
+
+    def release(self):
+        for reply in self.held:
+            self.replies.put(reply)
+        self.held.clear()
+
+    def readline(self):
+        if not self.is_open:
+            raise serial.SerialException("closed")
+        try:
+            return (self.replies.get(timeout=0.02) + "\n").encode('ascii')
+        except queue.Empty:
+            return b""
+
+    def close(self):
+        self.is_open = False
+
+
+class TestArduinoHID:
+    def setup_method(self):
+        Logger.init()
+        Logger.remove_file_logger()
+
+    @pytest.fixture
+    def hid(self, monkeypatch):
+        fake = FakeSerial()
+        monkeypatch.setattr(arduino_hid.serial, "Serial", lambda **kwargs: fake)
+        monkeypatch.setattr(arduino_hid.time, "sleep", lambda _: None)
+        hid = ArduinoHID(port="FAKE", timeout=0.2)
+        assert hid.connect()
+        yield hid, fake
+        hid.disconnect()
+
+    def test_ack_counting(self, hid):
+        hid, fake = hid
+        for _ in range(3):
+            assert hid.send_raw("MOUSE_MOVE:1:1", wait_ack=False)
+        assert hid._outstanding == 3
+        # An acknowledged command reaps every reply owed before it, then its own
+        assert hid.send_raw("PING")
+        assert hid._outstanding == 0
+        assert len(fake.written) == 4
+
+    def test_outstanding_is_bounded(self, hid):
+        hid, _ = hid
+        for _ in range(3 * hid._outstanding_max):
+            hid.send_raw("MOUSE_MOVE:1:1", wait_ack=False)
+            assert hid._outstanding <= hid._outstanding_max
+
+    def test_err_reply(self, hid):
+        hid, _ = hid
+        assert not hid.send_raw("BAD")
+        assert hid.send_raw("PING")
+
+    def test_sync(self, hid):
+        hid, _ = hid
+        for _ in range(5):
+            hid.send_raw("MOUSE_MOVE:1:1", wait_ack=False)
+        assert hid.sync()
+        assert hid._outstanding == 0
+        hid.send_raw("BAD", wait_ack=False)
+        hid.send_raw("MOUSE_MOVE:1:1", wait_ack=False)
+        assert not hid.sync()
+        assert hid._outstanding == 0
+
+    def test_late_reply_not_credited_to_next_command(self, hid):
+        hid, fake = hid
+        fake.auto_reply = False
+        hid.send_raw("BAD", wait_ack=False)
+        # The ERR for BAD doesn't arrive in time
+        assert not hid.sync()
+        assert hid._outstanding == 0
+        assert hid._late == 1
+        # ...then shows up late, ahead of the next command's OK
+        fake.release()
+        fake.auto_reply = True
+        assert hid.send_raw("PING")
+        assert hid._late == 0
+        assert hid.sync()
+
+    def test_send_batch_single_write(self, hid):
+        hid, fake = hid
+        assert hid.send_batch(["MOUSE_MOVE:1:1", b"MOUSE_MOVE:2:2\n", "MOUSE_MOVE:3:3"])
+        assert fake.writes == 1
+        assert fake.written == ["MOUSE_MOVE:1:1", "MOUSE_MOVE:2:2", "MOUSE_MOVE:3:3"]
+        assert hid._outstanding == 3
+        assert hid.sync()
+
+    def test_send_batch_respects_outstanding_bound(self, hid):
+        hid, fake = hid
+        commands = ["MOUSE_MOVE:1:1"] * (2 * hid._outstanding_max + 3)
+        assert hid.send_batch(commands)
+        assert hid._outstanding <= hid._outstanding_max
+        assert len(fake.written) == len(commands)
+        assert not hid.send_batch(["MOUSE_MOVE:1:1", "BAD"], wait_ack=True)
+        assert hid._outstanding == 0
+
+    def test_mouse_move_path_frames_in_one_write(self, hid):
+        hid, fake = hid
+        deltas = [(i, -i) for i in range(25)]
+        hid.mouse_move_path(deltas)
+        assert fake.writes == 1
+        assert [line.split(":")[1] for line in fake.written] == ["10", "10", "5"]
@@ -0,0 +1,39 @@
+import numpy as np
+from logger import Logger
+from utils import custom_mouse
+from utils.custom_mouse import mouse
+
+
+class FakeMatch:
+    def __init__(self, valid):
+        self.valid = valid
+
+
+class TestClickGuard:
+    def setup_method(self):
+        Logger.init()
+        Logger.remove_file_logger()
+        custom_mouse._last_inventory_check[:] = [0.0, None, False, None]
+
+    def test_click_in_equipped_area_after_unreported_close(self, monkeypatch):
+        _, equipped_roi, _ = custom_mouse._click_guard_rois()
+        x, y, w, h = equipped_roi
+        click_pos = (x + w // 2, y + h // 2)
+        # The gold button template "matches" whenever the frame isn't blank
+        frame_open = np.full((720, 1280, 3), 255, dtype=np.uint8)
+        frame_closed = np.zeros((720, 1280, 3), dtype=np.uint8)
+        frame = [frame_open]
+        clock = [100.0]
+        monkeypatch.setattr(custom_mouse.screen, "grab", lambda: frame[0])
+        monkeypatch.setattr(custom_mouse.screen, "convert_monitor_to_screen", lambda pos: pos)
+        monkeypatch.setattr(custom_mouse.template_finder, "search", lambda ref, img, **kwargs: FakeMatch(bool(img.any())))
+        monkeypatch.setattr(custom_mouse.time, "perf_counter", lambda: clock[0])
+        monkeypatch.setattr(mouse, "get_position", staticmethod(lambda: click_pos))
+
+        # Inventory open: the click is cancelled
+        assert not mouse._is_clicking_safe()
+
+        # Closed by a plain esc that nothing reports; a later click must go through
+        frame[0] = frame_closed
+        clock[0] += 1.0
+        assert mouse._is_clicking_safe()
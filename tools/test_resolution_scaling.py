@@ -1,11 +1,24 @@
 """
 Standalone validation of resolution scaling logic.
-No botty dependencies required - just reads INI and applies math.
+No botty dependencies required - just reads INI and applies math (numpy).
 
 Run: python tools/test_resolution_scaling.py
 """
-import configparser
+import functools
+import hashlib
+import json
 import os
+import sys
+import tempfile
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 RESOLUTION_PRESETS = {
     "720p":  (1280, 720, 1.0),
@@ -14,59 +27,223 @@ RESOLUTION_PRESETS = {
     "4k":    (3840, 2160, 3.0),
 }
 
+# Each preset's scale as an exact num/den ratio, so scaling stays in integer math
+SCALE_NUM_DEN = {
+    "720p":  (1, 1),
+    "1080p": (3, 2),
+    "1440p": (2, 1),
+    "4k":    (3, 1),
+}
+
+# Parsed game.ini is cached in the user cache dir (not the source tree), keyed on the
+# cache format version and the INI's mtime and size. Bump the version when the parser changes.
+INI_CACHE_VERSION = 1
+INI_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME')
+    or (os.environ.get('LOCALAPPDATA') if sys.platform == 'win32' else None)
+    or os.path.join(os.path.expanduser('~'), '.cache'),
+    'pindlebot',
+)
+
+# Sample report line formats
+POS_FMT = "    {:25s} = {:6d}  (720p: {})"
+ROI_FMT = "    {:25s} = {:30s}  (720p: {})"
+PATH_FMT = "    {:25s} = {}\n    {:25s}   (720p: {})"
+
+
+def format_path(pts):
+    """Render an (N, 2) point array the way the list-of-tuples paths used to print."""
+    return str(list(map(tuple, pts.tolist())))
+
+
+def _parse_game_ini(text):
+    """Parse the ui_pos/ui_roi/path sections into plain dicts (paths as flat int lists)."""
+    # game.ini is flat `key=int` / `key=csv of ints`, so a single pass beats configparser
+    ui_pos, ui_roi, paths = {}, {}, {}
+    section = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[':
+            section = line[1:line.index(']')]
+            continue
+        if section not in ('ui_pos', 'ui_roi', 'path'):
+            continue
+        key, _, val = line.partition('=')
+        # configparser lowercases keys; keep that behavior
+        key = key.strip().lower()
+        if section == 'ui_pos':
+            ui_pos[key] = int(val)
+        elif section == 'ui_roi':
+            ui_roi[key] = list(map(int, val.split(',')))
+        else:
+            paths[key] = list(map(int, val.split(',')))
+    return {'ui_pos': ui_pos, 'ui_roi': ui_roi, 'path': paths}
+
+
+def _load_parsed_ini(ini_path):
+    """Parsed game.ini sections, reused from a JSON cache while its version and the INI's mtime/size match."""
+    st = os.stat(ini_path)
+    stamp = [INI_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+    # One cache file per INI, so several checkouts can share the cache dir
+    path_key = hashlib.blake2b(os.path.abspath(ini_path).encode(), digest_size=8).hexdigest()
+    cache_path = os.path.join(INI_CACHE_DIR, f"game_ini_{path_key}.json")
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = _loads(f.read())
+        if cached.get('stamp') == stamp:
+            return cached['data']
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    with open(ini_path) as f:
+        data = _parse_game_ini(f.read())
+    tmp_path = None
+    try:
+        # Write then rename, so a concurrent reader never sees a half-written cache
+        os.makedirs(INI_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=INI_CACHE_DIR, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            json.dump({'stamp': stamp, 'data': data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Unwritable cache dir: just parse again next run
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return data
+
+
+@functools.lru_cache(maxsize=1)
 def load_game_ini():
-    """Load game.ini values at 720p baseline."""
-    parser = configparser.ConfigParser()
+    """Load game.ini values at 720p baseline. Parsed once; the mappings are read-only views."""
     ini_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'game.ini')
-    parser.read(ini_path)
+    data = _load_parsed_ini(ini_path)
 
-    ui_pos = {}
-    for key in parser['ui_pos']:
-        ui_pos[key] = int(parser['ui_pos'][key])
+    ui_pos, ui_roi, paths = data['ui_pos'], data['ui_roi'], {}
+    for key, vals in data['path'].items():
+        # Paths are stored as (N, 2) int32 point arrays; read-only like the mappings
+        pts = np.array(vals, dtype=np.int32).reshape(-1, 2)
+        pts.flags.writeable = False
+        paths[key] = pts
 
-    ui_roi = {}
-    for key in parser['ui_roi']:
-        ui_roi[key] = [int(x) for x in parser['ui_roi'][key].split(',')]
+    return MappingProxyType(ui_pos), MappingProxyType(ui_roi), MappingProxyType(paths)
 
-    paths = {}
-    for key in parser['path']:
-        vals = [int(x) for x in parser['path'][key].split(',')]
-        paths[key] = [(vals[i], vals[i+1]) for i in range(0, len(vals), 2)]
 
-    return ui_pos, ui_roi, paths
+SCREEN_KEYS = {'screen_width', 'screen_height', 'center_x', 'center_y'}
 
 
-def scale_values(ui_pos, ui_roi, paths, res_name):
-    """Apply resolution scaling to a copy of the values."""
-    width, height, scale = RESOLUTION_PRESETS[res_name]
+@functools.lru_cache(maxsize=1)
+def _baseline_arrays():
+    """The baseline values packed into int32 arrays once, for scale_values."""
+    ui_pos, ui_roi, paths = load_game_ini()
+    pos_keys = [k for k in ui_pos if k not in SCREEN_KEYS]
+    pos_arr = np.fromiter((ui_pos[k] for k in pos_keys), dtype=np.int32, count=len(pos_keys))
+    roi_arr = np.array(list(ui_roi.values()), dtype=np.int32).reshape(-1, 4)
+    # All path points across all keys go into one (M, 2) array, split back per key
+    points = np.concatenate(list(paths.values())) if paths else np.empty((0, 2), dtype=np.int32)
+    sections = np.cumsum([len(pts) for pts in paths.values()])[:-1]
+    return pos_keys, pos_arr, roi_arr, points, sections
+
+
+def _scale_int(arr, num, den):
+    """int(x * num / den) for every element, computed without floats (truncates toward zero like int())."""
+    prod = arr.astype(np.int64) * num
+    return (np.sign(prod) * (np.abs(prod) // den)).astype(np.int32)
 
+
+@functools.lru_cache(maxsize=len(RESOLUTION_PRESETS))
+def scale_values(res_name):
+    """Baseline game.ini values scaled to a resolution preset. Cached per preset; read-only."""
+    width, height, _ = RESOLUTION_PRESETS[res_name]
+    num, den = SCALE_NUM_DEN[res_name]
+    ui_pos, ui_roi, paths = load_game_ini()
+    pos_keys, pos_arr, roi_arr, points, sections = _baseline_arrays()
+
+    # Each section is scaled in a single multiply
     scaled_pos = dict(ui_pos)
+    scaled_pos.update(zip(pos_keys, _scale_int(pos_arr, num, den).tolist()))
     scaled_pos['screen_width'] = width
     scaled_pos['screen_height'] = height
     scaled_pos['center_x'] = width // 2
     scaled_pos['center_y'] = height // 2
-    skip = {'screen_width', 'screen_height', 'center_x', 'center_y'}
-    for key in scaled_pos:
-        if key not in skip:
-            scaled_pos[key] = int(ui_pos[key] * scale)
 
-    scaled_roi = {}
-    for key in ui_roi:
-        scaled_roi[key] = [int(v * scale) for v in ui_roi[key]]
+    scaled_roi = dict(zip(ui_roi, _scale_int(roi_arr, num, den).tolist()))
+
+    scaled_points = _scale_int(points, num, den)
+    scaled_points.flags.writeable = False
+    scaled_paths = dict(zip(paths, np.split(scaled_points, sections)))
+
+    return MappingProxyType(scaled_pos), MappingProxyType(scaled_roi), MappingProxyType(scaled_paths)
+
+
+# --- Validation checks: each returns a list of error strings for one preset ---
+
+SCREEN_CHECK_KEYS = ('screen_width', 'screen_height', 'center_x', 'center_y')
+EXPECTED_SCREEN = {name: (w, h, w // 2, h // 2) for name, (w, h, _) in RESOLUTION_PRESETS.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _baseline_save_and_exit():
+    """Baseline-only quantities, computed once: (save_and_exit_x, its ratio to screen_width)."""
+    ui_pos, _, _ = load_game_ini()
+    return ui_pos['save_and_exit_x'], ui_pos['save_and_exit_x'] / ui_pos['screen_width']
+
+
+def check_screen(res_name):
+    pos, _, _ = scale_values(res_name)
+    screen = tuple(pos[k] for k in SCREEN_CHECK_KEYS)
+    if screen == EXPECTED_SCREEN[res_name]:
+        return []
+    return [f"{res_name}: {key}={got}, expected {expected}"
+            for key, got, expected in zip(SCREEN_CHECK_KEYS, screen, EXPECTED_SCREEN[res_name]) if got != expected]
+
 
-    scaled_paths = {}
-    for key in paths:
-        scaled_paths[key] = [(int(x * scale), int(y * scale)) for x, y in paths[key]]
+def check_save_and_exit(res_name):
+    """save_and_exit scales correctly"""
+    pos, _, _ = scale_values(res_name)
+    expected = int(_baseline_save_and_exit()[0] * RESOLUTION_PRESETS[res_name][2])
+    if pos['save_and_exit_x'] != expected:
+        return [f"{res_name}: save_and_exit_x={pos['save_and_exit_x']}, expected {expected}"]
+    return []
 
-    return scaled_pos, scaled_roi, scaled_paths
+
+def check_rois(res_name):
+    """ROIs scale correctly (all 4 components)"""
+    _, ui_roi, _ = load_game_ini()
+    _, roi, _ = scale_values(res_name)
+    s = RESOLUTION_PRESETS[res_name][2]
+    errors = []
+    for roi_key in ['play_btn', 'health_globe']:
+        if roi_key in roi:
+            for i, component in enumerate(['left', 'top', 'width', 'height']):
+                expected = int(ui_roi[roi_key][i] * s)
+                if roi[roi_key][i] != expected:
+                    errors.append(f"{res_name}: {roi_key}[{component}]={roi[roi_key][i]}, expected {expected}")
+    return errors
+
+
+def check_proportions(res_name):
+    """save_and_exit stays near center horizontally"""
+    pos, _, _ = scale_values(res_name)
+    baseline_ratio = _baseline_save_and_exit()[1]
+    ratio = pos['save_and_exit_x'] / pos['screen_width']
+    if abs(ratio - baseline_ratio) > 0.01:
+        return [f"{res_name}: save_exit ratio {ratio:.3f} differs from 720p {baseline_ratio:.3f}"]
+    return []
+
+
+RESOLUTION_CHECKS = (check_screen, check_save_and_exit, check_rois, check_proportions)
 
 
 def main():
+    # Report lines are collected and written to stdout once at the end
+    out = []
     ui_pos, ui_roi, paths = load_game_ini()
 
-    print("=" * 70)
-    print("Resolution Scaling Validation")
-    print("=" * 70)
+    out.append("=" * 70)
+    out.append("Resolution Scaling Validation")
+    out.append("=" * 70)
 
     # Show key values at each resolution
     sample_pos_keys = ['screen_width', 'screen_height', 'center_x', 'center_y',
@@ -79,77 +256,43 @@ def main():
         if s == 1.0:
             pos, roi, path = ui_pos, ui_roi, paths
         else:
-            pos, roi, path = scale_values(ui_pos, ui_roi, paths, res_name)
-
-        print(f"\n--- {res_name} ({w}x{h}, scale={s}x) ---")
-        print(f"  UI Positions:")
-        for key in sample_pos_keys:
-            if key in pos:
-                orig = ui_pos[key]
-                print(f"    {key:25s} = {pos[key]:6d}  (720p: {orig})")
-
-        print(f"  UI ROIs [left, top, width, height]:")
-        for key in sample_roi_keys:
-            if key in roi:
-                orig = ui_roi[key]
-                print(f"    {key:25s} = {str(roi[key]):30s}  (720p: {orig})")
-
-        print(f"  Paths:")
-        for key in sample_path_keys:
-            if key in path:
-                orig = paths[key]
-                print(f"    {key:25s} = {path[key]}")
-                print(f"    {'':25s}   (720p: {orig})")
+            pos, roi, path = scale_values(res_name)
+
+        out.append(f"\n--- {res_name} ({w}x{h}, scale={s}x) ---")
+        out.append("  UI Positions:")
+        out.extend(POS_FMT.format(key, pos[key], ui_pos[key]) for key in sample_pos_keys if key in pos)
+
+        out.append("  UI ROIs [left, top, width, height]:")
+        out.extend(ROI_FMT.format(key, "[" + ", ".join(map(str, roi[key])) + "]", ui_roi[key])
+                   for key in sample_roi_keys if key in roi)
+
+        out.append("  Paths:")
+        out.extend(PATH_FMT.format(key, format_path(path[key]), "", format_path(paths[key])) for key in sample_path_keys if key in path)
 
     # Validation checks
-    print(f"\n{'=' * 70}")
-    print("Validation Checks")
-    print("=" * 70)
+    out.append(f"\n{'=' * 70}")
+    out.append("Validation Checks")
+    out.append("=" * 70)
     errors = []
-
-    for res_name, (w, h, s) in RESOLUTION_PRESETS.items():
+    for res_name, (_, _, s) in RESOLUTION_PRESETS.items():
         if s == 1.0:
             continue
-        pos, roi, _ = scale_values(ui_pos, ui_roi, paths, res_name)
-
-        if pos['screen_width'] != w:
-            errors.append(f"{res_name}: screen_width={pos['screen_width']}, expected {w}")
-        if pos['screen_height'] != h:
-            errors.append(f"{res_name}: screen_height={pos['screen_height']}, expected {h}")
-        if pos['center_x'] != w // 2:
-            errors.append(f"{res_name}: center_x={pos['center_x']}, expected {w // 2}")
-
-        # Check save_and_exit scales correctly
-        expected = int(ui_pos['save_and_exit_x'] * s)
-        if pos['save_and_exit_x'] != expected:
-            errors.append(f"{res_name}: save_and_exit_x={pos['save_and_exit_x']}, expected {expected}")
-
-        # Check ROI scales correctly (all 4 components)
-        for roi_key in ['play_btn', 'health_globe']:
-            if roi_key in roi:
-                for i, component in enumerate(['left', 'top', 'width', 'height']):
-                    expected = int(ui_roi[roi_key][i] * s)
-                    if roi[roi_key][i] != expected:
-                        errors.append(f"{res_name}: {roi_key}[{component}]={roi[roi_key][i]}, expected {expected}")
-
-        # Check proportions: save_and_exit should be near center horizontally
-        ratio = pos['save_and_exit_x'] / pos['screen_width']
-        baseline_ratio = ui_pos['save_and_exit_x'] / ui_pos['screen_width']
-        if abs(ratio - baseline_ratio) > 0.01:
-            errors.append(f"{res_name}: save_exit ratio {ratio:.3f} differs from 720p {baseline_ratio:.3f}")
+        for check in RESOLUTION_CHECKS:
+            errors.extend(check(res_name))
 
     if errors:
-        print(f"\nFAILED ({len(errors)} errors):")
+        out.append(f"\nFAILED ({len(errors)} errors):")
         for e in errors:
-            print(f"  X {e}")
+            out.append(f"  X {e}")
     else:
-        print(f"\nALL CHECKS PASSED")
-        print(f"  - Screen dimensions correct for all resolutions")
-        print(f"  - UI positions scale linearly")
-        print(f"  - ROI rectangles scale all 4 components")
-        print(f"  - Proportional positions preserved across resolutions")
+        out.append(f"\nALL CHECKS PASSED")
+        out.append(f"  - Screen dimensions correct for all resolutions")
+        out.append(f"  - UI positions scale linearly")
+        out.append(f"  - ROI rectangles scale all 4 components")
+        out.append(f"  - Proportional positions preserved across resolutions")
 
-    print("=" * 70)
+    out.append("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':
@@ -9,6 +9,9 @@ import cv2
 import numpy as np
 import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 RESOLUTION_PRESETS = {
     "720p":  (1280, 720, 1.0),
@@ -17,128 +20,224 @@ RESOLUTION_PRESETS = {
     "4k":    (3840, 2160, 3.0),
 }
 
-def scale_template(img, scale):
+def scale_template(img, scale, dst=None):
+    """Resize img by scale. If given, dst is written in place when it has the output shape/dtype."""
     if scale == 1.0 or img is None:
         return img
     h, w = img.shape[:2]
     new_w = max(1, int(w * scale))
     new_h = max(1, int(h * scale))
+    out_shape = (new_h, new_w) + img.shape[2:]
+    if dst is None or dst.shape != out_shape or dst.dtype != img.dtype:
+        dst = np.empty(out_shape, dtype=img.dtype)
     interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
-    return cv2.resize(img, (new_w, new_h), interpolation=interp)
+    return cv2.resize(img, (new_w, new_h), dst=dst, interpolation=interp)
+
+_thread_local = threading.local()
+# (scale, input shape, dtype) -> shape scale_template produced for it
+_scaled_shapes = {}
+
+
+def alpha_has_zero(img):
+    """True if img has an alpha channel with any fully transparent pixel, i.e. alpha_to_mask returns a mask."""
+    # cv2.minMaxLoc is a single SIMD pass, cheaper than np.min's generic reduction
+    return img is not None and img.shape[2] == 4 and cv2.minMaxLoc(img[:, :, 3])[0] == 0
+
 
 def alpha_to_mask(img):
-    if img is not None and img.shape[2] == 4:
-        if np.min(img[:, :, 3]) == 0:
-            _, mask = cv2.threshold(img[:, :, 3], 1, 255, cv2.THRESH_BINARY)
-            return mask
+    if alpha_has_zero(img):
+        _, mask = cv2.threshold(img[:, :, 3], 1, 255, cv2.THRESH_BINARY)
+        return mask
     return None
 
 
-def main():
-    assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets')
-    template_dirs = ['templates', 'npc', 'shop', 'item_properties', 'chests', 'gamble']
+def fast_imread(path):
+    """cv2.imread(path, IMREAD_UNCHANGED) via one buffered read + imdecode. None on failure."""
+    try:
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            buf = f.read()
+    except OSError:
+        return None
+    if not buf:
+        return None
+    return cv2.imdecode(np.frombuffer(buf, np.uint8), cv2.IMREAD_UNCHANGED)
 
-    # Collect all template PNGs
+
+def iter_pngs(root):
+    """PNG paths under root in os.walk order (a directory's files, then its subdirectories)."""
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(('.png', '.PNG')):
+                yield entry.path
+    for path in subdirs:
+        yield from iter_pngs(path)
+
+
+TEMPLATE_DIRS = ['templates', 'npc', 'shop', 'item_properties', 'chests', 'gamble']
+
+
+def collect_pngs(assets_dir):
+    """All template PNG paths under the TEMPLATE_DIRS of assets_dir, in walk order."""
     all_pngs = []
-    for subdir in template_dirs:
+    for subdir in TEMPLATE_DIRS:
         dirpath = os.path.join(assets_dir, subdir)
         if not os.path.isdir(dirpath):
             continue
-        for root, _, files in os.walk(dirpath):
-            for f in files:
-                if f.lower().endswith('.png'):
-                    all_pngs.append(os.path.join(root, f))
-
-    print(f"Found {len(all_pngs)} template PNGs\n")
+        all_pngs.extend(iter_pngs(dirpath))
+    return all_pngs
+
+
+def check_template(png_path, img, resolutions, assets_dir):
+    """Validate a decoded template's scaling at each (res_name, scale).
+
+    Returns (png_path, {res_name: (scaled_ok, has_alpha, alpha_ok, error, sample_line)}),
+    or (png_path, None) if the PNG failed to load (img is None).
+    """
+    if img is None:
+        return png_path, None
+
+    rel = os.path.relpath(png_path, assets_dir)
+    # Shape, channel count and labels read once per template
+    shp = img.shape
+    orig_h, orig_w = shp[0], shp[1]
+    orig_channels = shp[2] if len(shp) == 3 else 1
+    has_alpha = orig_channels == 4
+    alpha = "BGRA" if has_alpha else "BGR"
+    # The mask checks only need to know whether a mask exists, not the thresholded mask itself
+    orig_has_zero = has_alpha and alpha_has_zero(img)
+
+    # Resize output buffers are reused per (scale, input shape, dtype); one cache per worker thread
+    dst_cache = getattr(_thread_local, "dst_cache", None)
+    if dst_cache is None:
+        dst_cache = _thread_local.dst_cache = {}
+
+    res_results = {}
+    for res_name, scale in resolutions:
+        # Scale it
+        key = (scale, shp, img.dtype.str)
+        # Output shape depends only on (scale, input shape), so after one real resize per key
+        # templates without alpha reuse the measured shape; alpha ones are resized for the mask check
+        new_shp = _scaled_shapes.get(key)
+        if new_shp is None or has_alpha:
+            scaled = dst_cache[key] = scale_template(img, scale, dst_cache.get(key))
+            new_shp = _scaled_shapes[key] = scaled.shape
+        new_h, new_w = new_shp[0], new_shp[1]
+        new_channels = new_shp[2] if len(new_shp) == 3 else 1
+        sample = f"  {rel}: {orig_w}x{orig_h} -> {new_w}x{new_h} ({alpha})"
+
+        # Validate dimensions
+        expected_w = max(1, int(orig_w * scale))
+        expected_h = max(1, int(orig_h * scale))
+        if new_w != expected_w or new_h != expected_h:
+            error = f"{res_name} {rel}: got {new_w}x{new_h}, expected {expected_w}x{expected_h}"
+            res_results[res_name] = (False, False, False, error, sample)
+            continue
 
-    # Test scaling for each resolution
-    errors = []
-    for res_name, (w, h, scale) in RESOLUTION_PRESETS.items():
-        if scale == 1.0:
+        # Validate channels preserved
+        if new_channels != orig_channels:
+            error = f"{res_name} {rel}: channels changed {orig_channels} -> {new_channels}"
+            res_results[res_name] = (False, False, False, error, sample)
             continue
 
-        print(f"--- Testing {res_name} ({scale}x) ---")
-        scaled_ok = 0
-        alpha_ok = 0
-        alpha_total = 0
+        # Validate alpha mask still works
+        alpha_ok = False
+        error = None
+        if has_alpha:
+            # Still scanned per resolution: INTER_CUBIC can undershoot to 0, so an
+            # opaque template may gain transparent pixels after scaling
+            scaled_has_zero = alpha_has_zero(scaled)
+            if orig_has_zero == scaled_has_zero:
+                alpha_ok = True
+                # Mask (the alpha plane thresholded) should match scaled dimensions
+                mask_shape = scaled.shape[:2]
+                if scaled_has_zero and mask_shape != (new_h, new_w):
+                    error = f"{res_name} {rel}: mask shape {mask_shape} != image {(new_h, new_w)}"
+            else:
+                error = f"{res_name} {rel}: alpha mask existence changed after scaling"
+        res_results[res_name] = (True, has_alpha, alpha_ok, error, sample)
+    return png_path, res_results
 
-        for png_path in all_pngs:
-            img = cv2.imread(png_path, cv2.IMREAD_UNCHANGED)
-            if img is None:
-                errors.append(f"Failed to load: {png_path}")
-                continue
 
-            orig_h, orig_w = img.shape[:2]
-            orig_channels = img.shape[2] if len(img.shape) == 3 else 1
-            has_alpha = orig_channels == 4
-
-            # Scale it
-            scaled = scale_template(img, scale)
-            new_h, new_w = scaled.shape[:2]
-            new_channels = scaled.shape[2] if len(scaled.shape) == 3 else 1
-
-            # Validate dimensions
-            expected_w = max(1, int(orig_w * scale))
-            expected_h = max(1, int(orig_h * scale))
-            if new_w != expected_w or new_h != expected_h:
-                rel = os.path.relpath(png_path, assets_dir)
-                errors.append(f"{res_name} {rel}: got {new_w}x{new_h}, expected {expected_w}x{expected_h}")
-                continue
+def main():
+    # Report lines are collected and written to stdout once at the end
+    out = []
+    assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets')
 
-            # Validate channels preserved
-            if new_channels != orig_channels:
-                rel = os.path.relpath(png_path, assets_dir)
-                errors.append(f"{res_name} {rel}: channels changed {orig_channels} -> {new_channels}")
+    # Collect all template PNGs
+    all_pngs = collect_pngs(assets_dir)
+
+    out.append(f"Found {len(all_pngs)} template PNGs\n")
+
+    # Each PNG is decoded once and checked at every resolution; cv2 releases the GIL
+    # while decoding/resizing, so both stages run in parallel threads
+    resolutions = [(res_name, scale) for res_name, (_, _, scale) in RESOLUTION_PRESETS.items() if scale != 1.0]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        images = list(executor.map(fast_imread, all_pngs))
+
+        # Same-shaped templates are checked back to back by one worker, so its resize
+        # buffers and interpolation tables stay warm across the whole bucket
+        buckets = defaultdict(list)
+        for i, img in enumerate(images):
+            buckets[None if img is None else (img.shape, img.dtype.str)].append(i)
+
+        def check_bucket(indices):
+            return [(i, check_template(all_pngs[i], images[i], resolutions, assets_dir)) for i in indices]
+
+        results = [None] * len(all_pngs)
+        for bucket in executor.map(check_bucket, buckets.values()):
+            for i, result in bucket:
+                results[i] = result
+
+    # One pass over the results (PNG outer, scale inner) accumulates every resolution's counters
+    counters = {res_name: {"scaled_ok": 0, "alpha_ok": 0, "alpha_total": 0, "errors": []}
+                for res_name, _ in resolutions}
+    for png_path, res_results in results:
+        for res_name, _ in resolutions:
+            c = counters[res_name]
+            if res_results is None:
+                c["errors"].append(f"Failed to load: {png_path}")
                 continue
-
-            scaled_ok += 1
-
-            # Validate alpha mask still works
-            if has_alpha:
-                alpha_total += 1
-                orig_mask = alpha_to_mask(img)
-                scaled_mask = alpha_to_mask(scaled)
-                if (orig_mask is not None) == (scaled_mask is not None):
-                    alpha_ok += 1
-                    if scaled_mask is not None:
-                        # Mask should match scaled dimensions
-                        if scaled_mask.shape != (new_h, new_w):
-                            rel = os.path.relpath(png_path, assets_dir)
-                            errors.append(f"{res_name} {rel}: mask shape {scaled_mask.shape} != image {(new_h, new_w)}")
-                else:
-                    rel = os.path.relpath(png_path, assets_dir)
-                    errors.append(f"{res_name} {rel}: alpha mask existence changed after scaling")
-
-        print(f"  Templates scaled: {scaled_ok}/{len(all_pngs)}")
-        if alpha_total > 0:
-            print(f"  Alpha masks OK:   {alpha_ok}/{alpha_total}")
+            ok, has_alpha, alpha_match, error, _ = res_results[res_name]
+            c["scaled_ok"] += ok
+            c["alpha_total"] += has_alpha
+            c["alpha_ok"] += alpha_match
+            if error:
+                c["errors"].append(error)
+
+    # Report each resolution
+    errors = []
+    for res_name, scale in resolutions:
+        c = counters[res_name]
+        errors.extend(c["errors"])
+        out.append(f"--- Testing {res_name} ({scale}x) ---")
+        out.append(f"  Templates scaled: {c['scaled_ok']}/{len(all_pngs)}")
+        if c["alpha_total"] > 0:
+            out.append(f"  Alpha masks OK:   {c['alpha_ok']}/{c['alpha_total']}")
 
         # Show some example dimensions
-        sample = all_pngs[:3]
-        for png_path in sample:
-            img = cv2.imread(png_path, cv2.IMREAD_UNCHANGED)
-            if img is None:
+        for png_path, res_results in results[:3]:
+            if res_results is None:
                 continue
-            scaled = scale_template(img, scale)
-            rel = os.path.relpath(png_path, assets_dir)
-            oh, ow = img.shape[:2]
-            nh, nw = scaled.shape[:2]
-            ch = img.shape[2] if len(img.shape) == 3 else 1
-            alpha = "BGRA" if ch == 4 else "BGR"
-            print(f"  {rel}: {ow}x{oh} -> {nw}x{nh} ({alpha})")
-        print()
-
-    print("=" * 60)
+            out.append(res_results[res_name][4])
+        out.append("")
+
+    out.append("=" * 60)
     if errors:
-        print(f"FAILED ({len(errors)} errors):")
+        out.append(f"FAILED ({len(errors)} errors):")
         for e in errors:
-            print(f"  X {e}")
+            out.append(f"  X {e}")
     else:
-        print("ALL CHECKS PASSED")
-        print(f"  - All {len(all_pngs)} templates scale correctly at 1.5x, 2x, 3x")
-        print(f"  - Channel count preserved (BGR/BGRA)")
-        print(f"  - Alpha masks preserved and dimensions match")
-    print("=" * 60)
+        out.append("ALL CHECKS PASSED")
+        out.append(f"  - All {len(all_pngs)} templates scale correctly at 1.5x, 2x, 3x")
+        out.append(f"  - Channel count preserved (BGR/BGRA)")
+        out.append(f"  - Alpha masks preserved and dimensions match")
+    out.append("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':